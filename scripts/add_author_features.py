@@ -0,0 +1,68 @@
+import sys
+import os
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.author_history import AuthorHistoryTracker, AUTHOR_HISTORY_FEATURES
+from extract.as_of_labels import AsOfLabelIndex, NEVER_FIXED, export_time
+
+
+if len(sys.argv) not in (4, 5):
+    print("Usage: python add_author_features.py <features_csv> <fix_index_npz> <output_csv> [state_file]")
+    sys.exit(1)
+
+input_csv = sys.argv[1]
+fix_index = AsOfLabelIndex.load(sys.argv[2])
+output_csv = sys.argv[3]
+state_file = sys.argv[4] if len(sys.argv) == 5 else None
+
+df = pd.read_csv(input_csv)
+
+# When each commit was first fixed; prior bugs only count once their fix is visible.
+# Fix times are UTC, so shift them into the time base of the commit_date column.
+df["_fix_time"] = [t if t == NEVER_FIXED else export_time(t)
+                   for t in fix_index.lookup_fix_times(df["commit_hash"]).tolist()]
+
+# Resume from an earlier run if a state file exists
+if state_file is not None and os.path.exists(state_file):
+    tracker = AuthorHistoryTracker.load(state_file)
+    print(f"Loaded author history state from {state_file}")
+else:
+    tracker = AuthorHistoryTracker()
+
+# git log lists newest first; reverse before the stable sort so ties keep history order
+order = df.iloc[::-1].sort_values("commit_date", kind="stable").index
+
+# Commits consumed by an earlier run (tracked by hash; commit dates of a new range overlap)
+consumed = tracker.seen(df.loc[order, "commit_hash"])
+skipped = int(consumed.sum())
+order = order[~consumed]
+
+rows = {name: [] for name in AUTHOR_HISTORY_FEATURES}
+kept = []
+
+for idx, commit_hash, author, committer, author_date, commit_date, fix_time in zip(
+    order,
+    df.loc[order, "commit_hash"],
+    df.loc[order, "author"],
+    df.loc[order, "committer"],
+    df.loc[order, "author_date"],
+    df.loc[order, "commit_date"],
+    df.loc[order, "_fix_time"]
+):
+    features = tracker.update(commit_hash, author, committer, author_date, commit_date, fix_time)
+    kept.append(idx)
+    for name in AUTHOR_HISTORY_FEATURES:
+        rows[name].append(features[name])
+
+if skipped:
+    print(f"Skipped {skipped} commits already covered by the saved state")
+
+history = pd.DataFrame(rows, index=kept)
+output = df.loc[kept].drop(columns="_fix_time").join(history).sort_index()
+output.to_csv(output_csv, index=False)
+print(f"Author history features saved to {output_csv}")
+
+if state_file is not None:
+    tracker.save(state_file)
+    print(f"Author history state saved to {state_file}")
@@ -0,0 +1,51 @@
+import sys
+import os
+import subprocess
+import statistics
+import time
+
+KBP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kbp.py")
+
+# Subcommands that must start without the heavy dependencies, with their cold-start
+# budget in seconds (interpreter + imports, median of runs). "evaluate" needs
+# scikit-learn metrics; importing TensorFlow alone takes several seconds.
+STARTUP_BUDGETS = {
+    "evaluate": 2.5,
+    "label": 1.0,
+}
+HEAVY_MODULES = ["tensorflow", "shap", "matplotlib", "git"]
+
+PROBE = """
+import runpy, sys
+sys.argv = [{kbp!r}, {command!r}]
+try:
+    runpy.run_path({kbp!r}, run_name="__main__")
+except SystemExit:
+    pass
+print("HEAVY:" + ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+runs = int(sys.argv[1]) if len(sys.argv) == 2 else 5
+failed = False
+
+for command, budget in STARTUP_BUDGETS.items():
+    code = PROBE.format(kbp=KBP, command=command, heavy=HEAVY_MODULES)
+    timings = []
+    loaded = ""
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        timings.append(time.perf_counter() - start)
+        loaded = result.stdout.rsplit("HEAVY:", 1)[-1].strip()
+
+    median = statistics.median(timings)
+    status = "OK"
+    if loaded or median > budget:
+        status = "FAIL"
+        failed = True
+
+    print(f"{command:10s} median {median:.3f}s (budget {budget:.1f}s) "
+          f"heavy imports: {loaded or 'none'} -> {status}")
+
+sys.exit(1 if failed else 0)
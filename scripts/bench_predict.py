@@ -0,0 +1,170 @@
+import sys
+import os
+import json
+import time
+import resource
+import numpy as np
+import pandas as pd
+import joblib
+import tensorflow as tf
+from tensorflow.keras.models import load_model
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+DATA = os.path.join(ROOT, "data", "Cutoff", "testing_data_v518_v519")
+REFERENCE = os.path.join(ROOT, "data", "Cutoff", "testing_data_v518_v519_predicted")
+
+# name -> (model, scaler, must match the committed predictions)
+MODELS = {
+    "full": ("models/bugfix_model.keras", "models/scaler.pkl", False),
+    "cutoff": ("models/bugfix_model_1_cutoff.keras", "models/scaler_cutoff.pkl", True),
+}
+
+BATCH_SIZES = [32, 256, 2048, None]  # None = whole dataset in one call
+LATENCY_BATCH_SIZES = [1, 16]
+LATENCY_CALLS = 200
+THROUGHPUT_REPEATS = 3
+
+# Probabilities must match the committed predictions and each other this closely
+TOLERANCE = 1e-5
+# A run fails against a baseline if throughput drops by more than this share
+MAX_SLOWDOWN = 0.25
+
+
+def peak_memory_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def inference_paths(model) -> dict:
+    """
+    Ways to score a float32 batch with the same Keras model.
+    """
+    signature = [tf.TensorSpec(shape=(None, model.input_shape[1]), dtype=tf.float32)]
+    compiled = tf.function(lambda x: model(x, training=False), input_signature=signature)
+
+    return {
+        "keras_predict": lambda X, batch: model.predict(X, batch_size=batch or len(X), verbose=0),
+        "predict_on_batch": lambda X, batch: np.concatenate(
+            [model.predict_on_batch(X[i:i + (batch or len(X))]) for i in range(0, len(X), batch or len(X))]),
+        "direct_call": lambda X, batch: np.concatenate(
+            [model(X[i:i + (batch or len(X))], training=False).numpy() for i in range(0, len(X), batch or len(X))]),
+        "tf_function": lambda X, batch: np.concatenate(
+            [compiled(X[i:i + (batch or len(X))]).numpy() for i in range(0, len(X), batch or len(X))]),
+    }
+
+
+def bench_model(name: str, model_path: str, scaler_path: str, df: pd.DataFrame, reference: np.ndarray,
+                must_match: bool) -> dict:
+    start = time.perf_counter()
+    model = load_model(os.path.join(ROOT, model_path))
+    scaler = joblib.load(os.path.join(ROOT, scaler_path))
+    load_seconds = time.perf_counter() - start
+
+    columns = list(scaler.feature_names_in_)
+    X = df.reindex(columns=columns, fill_value=0)  # tool_found is not part of the test export
+    X_scaled = scaler.transform(X).astype(np.float32)
+
+    result = {"model": name, "load_seconds": load_seconds, "rows": len(X_scaled), "paths": {}}
+    baseline_probs = None
+
+    for path_name, run in inference_paths(model).items():
+        run(X_scaled[:32], 32)  # warm-up / tracing
+        path_result = {"rows_per_sec": {}, "latency_ms": {}}
+
+        for batch in BATCH_SIZES:
+            timings = []
+            for _ in range(THROUGHPUT_REPEATS):
+                start = time.perf_counter()
+                probs = run(X_scaled, batch).flatten()
+                timings.append(time.perf_counter() - start)
+            path_result["rows_per_sec"][str(batch or "all")] = len(X_scaled) / min(timings)
+
+        for batch in LATENCY_BATCH_SIZES:
+            latencies = []
+            for i in range(LATENCY_CALLS):
+                offset = (i * batch) % (len(X_scaled) - batch)
+                start = time.perf_counter()
+                run(X_scaled[offset:offset + batch], batch)
+                latencies.append((time.perf_counter() - start) * 1000)
+            path_result["latency_ms"][str(batch)] = {
+                f"p{p}": float(np.percentile(latencies, p)) for p in (50, 95, 99)
+            }
+
+        if baseline_probs is None:
+            baseline_probs = probs
+        path_result["max_diff_vs_keras_predict"] = float(np.abs(probs - baseline_probs).max())
+        path_result["max_diff_vs_committed"] = float(np.abs(probs - reference).max())
+        path_result["ok"] = path_result["max_diff_vs_keras_predict"] <= TOLERANCE and (
+            not must_match or path_result["max_diff_vs_committed"] <= TOLERANCE)
+        result["paths"][path_name] = path_result
+
+    result["peak_memory_mb"] = peak_memory_mb()
+    return result
+
+
+def print_result(result: dict):
+    print(f"\n=== {result['model']} model ({result['rows']} rows, load {result['load_seconds']:.2f}s, "
+          f"peak RSS {result['peak_memory_mb']:.0f} MB) ===")
+    for path_name, r in result["paths"].items():
+        throughput = ", ".join(f"{b}: {v:,.0f}" for b, v in r["rows_per_sec"].items())
+        latency = ", ".join(f"b={b} p50 {v['p50']:.2f} / p95 {v['p95']:.2f} / p99 {v['p99']:.2f}"
+                            for b, v in r["latency_ms"].items())
+        print(f"{path_name:17s} rows/sec [{throughput}]")
+        print(f"{'':17s} latency ms [{latency}]")
+        print(f"{'':17s} max diff vs keras_predict {r['max_diff_vs_keras_predict']:.2e}, "
+              f"vs committed predictions {r['max_diff_vs_committed']:.2e} -> {'OK' if r['ok'] else 'FAIL'}")
+
+
+def compare_with_baseline(results: list, baseline: list) -> list[str]:
+    regressions = []
+    base = {r["model"]: r for r in baseline}
+    for result in results:
+        if result["model"] not in base:
+            continue
+        for path_name, r in result["paths"].items():
+            base_path = base[result["model"]]["paths"].get(path_name)
+            if base_path is None:
+                continue
+            for batch, rate in r["rows_per_sec"].items():
+                base_rate = base_path["rows_per_sec"].get(batch)
+                if base_rate and rate < base_rate * (1 - MAX_SLOWDOWN):
+                    regressions.append(f"{result['model']}/{path_name}/batch {batch}: "
+                                       f"{rate:,.0f} rows/sec vs baseline {base_rate:,.0f}")
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3:
+        print("Usage: python bench_predict.py [results_json] [baseline_json]")
+        sys.exit(1)
+
+    results_path = sys.argv[1] if len(sys.argv) >= 2 else None
+    baseline_path = sys.argv[2] if len(sys.argv) == 3 else None
+
+    df = pd.read_csv(DATA)
+    reference = pd.read_csv(REFERENCE)
+    if not (reference["commit_hash"].values == df["commit_hash"].values).all():
+        print("ERROR: committed predictions are not aligned with the test data.")
+        sys.exit(1)
+    reference = reference["bugfix_probability"].to_numpy()
+
+    results = []
+    for name, (model_path, scaler_path, must_match) in MODELS.items():
+        result = bench_model(name, model_path, scaler_path, df, reference, must_match)
+        print_result(result)
+        results.append(result)
+
+    if results_path:
+        with open(results_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {results_path}")
+
+    failed = [f"{r['model']}/{p}" for r in results for p, pr in r["paths"].items() if not pr["ok"]]
+    if baseline_path:
+        with open(baseline_path) as f:
+            failed += compare_with_baseline(results, json.load(f))
+
+    if failed:
+        print("\nFAILED:\n  " + "\n  ".join(failed))
+        sys.exit(1)
+    print("\nAll checks passed.")
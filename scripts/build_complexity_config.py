@@ -0,0 +1,24 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.dir_complexity import build_config_from_maintainers
+from extract.git_feature_extractor import DIR_COMPLEXITY
+
+
+if len(sys.argv) != 3:
+    print("Usage: python build_complexity_config.py <path_to_MAINTAINERS> <output_json>")
+    sys.exit(1)
+
+maintainers_path = sys.argv[1]
+output_file = sys.argv[2]
+
+config = build_config_from_maintainers(maintainers_path, DIR_COMPLEXITY)
+
+with open(output_file, "w") as f:
+    json.dump(config, f, indent=2)
+
+subsystems = {entry.get("subsystem") for entry in config["entries"]}
+print(f"Wrote {len(config['entries'])} prefixes for {len(subsystems)} subsystems to {output_file}")
+print("Scores are inherited from the top-level directory; edit the file to refine them.")
@@ -0,0 +1,42 @@
+import sys
+import os
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.as_of_labels import AsOfLabelIndex, hashes_to_keys
+
+
+if len(sys.argv) < 5:
+    print("Usage: python build_cutoff_datasets.py <features_csv> <fix_index_npz> <output_dir> <cutoff> [<cutoff> ...]")
+    print("Cutoffs are unix timestamps or dates like 2022-10-02.")
+    sys.exit(1)
+
+features_csv = sys.argv[1]
+index_path = sys.argv[2]
+output_dir = sys.argv[3]
+cutoff_args = sys.argv[4:]
+
+
+def parse_cutoff(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+    return int(pd.Timestamp(value, tz="UTC").timestamp())
+
+
+cutoffs = [parse_cutoff(value) for value in cutoff_args]
+
+df = pd.read_csv(features_csv)
+index = AsOfLabelIndex.load(index_path)
+
+# One lookup for all cutoffs
+keys = hashes_to_keys(df["commit_hash"])
+labels = index.labels_for_cutoffs(keys, cutoffs)
+
+os.makedirs(output_dir, exist_ok=True)
+base_name = os.path.splitext(os.path.basename(features_csv))[0]
+
+for i, (name, cutoff) in enumerate(zip(cutoff_args, cutoffs)):
+    df["label"] = labels[:, i]
+    output_file = os.path.join(output_dir, f"{base_name}_cutoff_{name.replace(':', '-')}.csv")
+    df.to_csv(output_file, index=False)
+    print(f"Cutoff {name}: {int(labels[:, i].sum())} buggy commits -> {output_file}")
@@ -0,0 +1,27 @@
+import sys
+import os
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from analysis.report import compute_report_data, write_report
+
+
+# Guard needed because the rendering processes may re-import this module
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4, 5):
+        print("Usage: python build_report.py <features_csv> <output_dir> [predictions_csv] [lifetimes_csv]")
+        sys.exit(1)
+
+    features_path = sys.argv[1]
+    output_dir = sys.argv[2]
+    predictions_path = sys.argv[3] if len(sys.argv) >= 4 else None
+    lifetimes_path = sys.argv[4] if len(sys.argv) == 5 else None
+
+    # Every input is read exactly once
+    df = pd.read_csv(features_path)
+    predictions = pd.read_csv(predictions_path) if predictions_path else None
+    lifetimes = pd.read_csv(lifetimes_path)["bug_lifetime_days"] if lifetimes_path else None
+
+    data = compute_report_data(df, predictions, lifetimes)
+    report_path = write_report(data, output_dir)
+    print(f"Report with {len(data['figures'])} figures saved to {report_path}")
@@ -0,0 +1,65 @@
+import sys
+import os
+import io
+import time
+from unidiff import PatchSet
+import git
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.diff_scanner import iter_file_diffs
+
+
+def patchset_summary(diff_text: str) -> list[tuple]:
+    """
+    Per-file summary of a diff as the previous PatchSet-based extraction saw it.
+    """
+    summary = []
+    for file in PatchSet(io.StringIO(diff_text)):
+        if file.is_added_file:
+            change_type = "new"
+        elif file.is_removed_file:
+            change_type = "deleted"
+        else:
+            change_type = "modified"
+        functions = frozenset(h.section_header.strip() for h in file if h.section_header.strip())
+        summary.append((file.path, change_type, file.added, file.removed, len(file), functions))
+    return summary
+
+
+if len(sys.argv) not in (2, 3, 4):
+    print("Usage: python check_diff_scanner.py <path_to_git_repo> [revision_range] [max_commits]")
+    sys.exit(1)
+
+repo = git.Repo(sys.argv[1])
+revision_range = sys.argv[2] if len(sys.argv) >= 3 else "HEAD"
+max_commits = int(sys.argv[3]) if len(sys.argv) == 4 else None
+
+checked = 0
+mismatches = []
+patchset_seconds = scanner_seconds = 0.0
+
+for commit in repo.iter_commits(revision_range, no_merges=True, max_count=max_commits):
+    if len(commit.parents) != 1:
+        continue
+
+    start = time.perf_counter()
+    expected = patchset_summary(repo.git.diff(commit.parents[0].hexsha, commit.hexsha))
+    patchset_seconds += time.perf_counter() - start
+
+    start = time.perf_counter()
+    process = repo.git.diff(commit.parents[0].hexsha, commit.hexsha, as_process=True)
+    scanned = [tuple(f) for f in iter_file_diffs(process.stdout)]
+    process.wait()
+    scanner_seconds += time.perf_counter() - start
+
+    checked += 1
+    if scanned != expected:
+        mismatches.append(commit.hexsha[:12])
+
+print(f"Checked {checked} commits")
+print(f"PatchSet: {patchset_seconds:.2f}s, scanner: {scanner_seconds:.2f}s (both including git diff)")
+
+if mismatches:
+    print(f"{len(mismatches)} commits differ: {', '.join(mismatches[:20])}")
+    sys.exit(1)
+print("Scanner matches PatchSet on every commit.")
@@ -2,36 +2,75 @@ import pandas as pd
 import random
 import re
 import sys
+import os
 
-if len(sys.argv) != 2:
-    print("Usage: python check_tool_ortho.py <predictions_and_tools_csv>")
-    sys.exit(1)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from analysis.tool_ortho import analyze_tool_orthogonality
 
-pred_path = sys.argv[1]
-df = pd.read_csv(pred_path)
-
-if "tool_found" not in df.columns:
-    print("ERROR: 'tool_found' column required in CSV.")
-    sys.exit(1)
+USAGE = "Usage: python check_tool_ortho.py <predictions_and_tools_csv> [full [n_bootstrap] [seed] [workers]]"
 
 # parameter
 NUM_SAMPLES = 400
 THRESHOLD_HIGH = 0.5
 THRESHOLD_LOW = 0.25
 
-# high & low grouping
-high = df[df["bugfix_probability"] >= THRESHOLD_HIGH].sample(n=NUM_SAMPLES)
-low = df[df["bugfix_probability"] < THRESHOLD_LOW].sample(n=NUM_SAMPLES)
 
 def count_tool_flags(df):
     return df["tool_found"].sum()
 
-high_tool_mentions = count_tool_flags(high)
-low_tool_mentions = count_tool_flags(low)
 
-print("=== Tool Mention Analysis ===")
-print(f"In HIGH group (model flagged as bugfix):")
-print(f"{high_tool_mentions} of {NUM_SAMPLES} messages mention known tools.")
+def run_sample_mode(df):
+    # high & low grouping
+    high = df[df["bugfix_probability"] >= THRESHOLD_HIGH].sample(n=NUM_SAMPLES)
+    low = df[df["bugfix_probability"] < THRESHOLD_LOW].sample(n=NUM_SAMPLES)
+
+    high_tool_mentions = count_tool_flags(high)
+    low_tool_mentions = count_tool_flags(low)
+
+    print("=== Tool Mention Analysis ===")
+    print(f"In HIGH group (model flagged as bugfix):")
+    print(f"{high_tool_mentions} of {NUM_SAMPLES} messages mention known tools.")
+
+    print(f"\nIn LOW group (model did NOT flag as bugfix):")
+    print(f"{low_tool_mentions} of {NUM_SAMPLES} messages mention known tools.")
+
+
+def run_full_mode(df, n_bootstrap, seed, workers):
+    result = analyze_tool_orthogonality(df, n_bootstrap=n_bootstrap, seed=seed, workers=workers,
+                                        threshold_high=THRESHOLD_HIGH, threshold_low=THRESHOLD_LOW)
+    summary = result["high_vs_low"]
+    pd.set_option("display.width", 200)
+
+    print(f"=== Tool Mention Analysis (full population, {n_bootstrap} bootstrap resamples, seed {seed}) ===")
+    print(f"HIGH group (>= {THRESHOLD_HIGH}): {summary['high_rate']:.4f} tool rate over {summary['high_commits']} commits")
+    print(f"LOW group (< {THRESHOLD_LOW}): {summary['low_rate']:.4f} tool rate over {summary['low_commits']} commits")
+    print(f"Difference: {summary['difference']:.4f} "
+          f"(95% CI {summary['difference_ci'][0]:.4f} .. {summary['difference_ci'][1]:.4f})")
+
+    print("\n=== Tool rate per probability bin ===")
+    print(result["bins"].round(4).to_string(index=False))
+
+    print("\n=== Tool rate above / below threshold ===")
+    print(result["thresholds"].round(4).to_string(index=False))
+
+
+# Guard needed because bootstrap worker processes may re-import this module
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or len(sys.argv) > 6 or (len(sys.argv) > 2 and sys.argv[2] != "full"):
+        print(USAGE)
+        sys.exit(1)
+
+    pred_path = sys.argv[1]
+    df = pd.read_csv(pred_path)
+
+    if "tool_found" not in df.columns:
+        print("ERROR: 'tool_found' column required in CSV.")
+        sys.exit(1)
 
-print(f"\nIn LOW group (model did NOT flag as bugfix):")
-print(f"{low_tool_mentions} of {NUM_SAMPLES} messages mention known tools.")
+    if len(sys.argv) > 2:
+        n_bootstrap = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+        seed = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+        workers = int(sys.argv[5]) if len(sys.argv) > 5 else 1
+        run_full_mode(df, n_bootstrap, seed, workers)
+    else:
+        run_sample_mode(df)
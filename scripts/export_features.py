@@ -1,19 +1,24 @@
 import sys
 import os
 import csv
+import argparse
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 from extract.git_feature_extractor import GitFeatureExtractor
 
 
-if len(sys.argv) != 3:
-    print("Usage: python export_features.py <path_to_git_repo> <output_csv>")
-    sys.exit(1)
+parser = argparse.ArgumentParser(description="Extract feature vectors from a Git repository.")
+parser.add_argument("repo_path", help="path to the Git repository")
+parser.add_argument("output_csv", help="output features CSV")
+parser.add_argument("complexity_config", nargs="?", help="path-prefix complexity config (JSON)")
+parser.add_argument("--hunk-features", action="store_true",
+                    help="add line, hunk, function and header/source file counts of each diff")
+args = parser.parse_args()
 
-repo_path = sys.argv[1]
-output_file = sys.argv[2]
+repo_path = args.repo_path
+output_file = args.output_csv
 
-extractor = GitFeatureExtractor(repo_path)
+extractor = GitFeatureExtractor(repo_path, complexity_config=args.complexity_config, hunk_features=args.hunk_features)
 fixed_hashes = extractor.find_fixed_commits()
 
 commits = list(extractor.get_commits())
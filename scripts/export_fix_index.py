@@ -0,0 +1,22 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.git_feature_extractor import GitFeatureExtractor
+from extract.as_of_labels import AsOfLabelIndex
+
+
+if len(sys.argv) not in (3, 4):
+    print("Usage: python export_fix_index.py <path_to_git_repo> <output_npz> [revision_range]")
+    sys.exit(1)
+
+repo_path = sys.argv[1]
+output_file = sys.argv[2]
+revision_range = sys.argv[3] if len(sys.argv) == 4 else "v5.17...v6.14"
+
+extractor = GitFeatureExtractor(repo_path)
+fix_times = extractor.find_fix_timestamps(revision_range)
+
+index = AsOfLabelIndex.from_fix_times(fix_times)
+index.save(output_file)
+print(f"Fix index with {len(index.keys)} buggy commits saved to {output_file}")
@@ -0,0 +1,33 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.release_jobs import run_release_jobs
+
+
+# Guard needed because worker processes may re-import this module
+if __name__ == "__main__":
+    hunk_features = "--hunk-features" in sys.argv
+    if hunk_features:
+        sys.argv.remove("--hunk-features")
+
+    if len(sys.argv) < 5:
+        print("Usage: python export_releases.py <path_to_git_repo> <output_dir> <fixes_range> <range> [<range> ...] "
+              "[--hunk-features]")
+        print("Example: python export_releases.py linux-stable releases/ v5.17...v6.14 v5.17...v5.18 v5.18...v5.19")
+        sys.exit(1)
+
+    repo_path = sys.argv[1]
+    output_dir = sys.argv[2]
+    fixes_range = sys.argv[3]
+    revision_ranges = sys.argv[4:]
+
+    manifest = run_release_jobs(repo_path, revision_ranges, output_dir, fixes_range=fixes_range,
+                                hunk_features=hunk_features)
+
+    failed = [name for name in revision_ranges if manifest["partitions"][name]["status"] != "done"]
+    if failed:
+        print(f"{len(failed)} partitions failed: {', '.join(failed)}. Rerun to retry them.")
+        sys.exit(1)
+
+    print(f"All partitions exported to {output_dir}")
@@ -0,0 +1,52 @@
+import sys
+import os
+import argparse
+import runpy
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(SCRIPTS_DIR, "..", "src")))
+
+# Subcommand -> (script, description). Scripts are only imported when their subcommand
+# runs, so TensorFlow, SHAP, matplotlib and GitPython are loaded only where needed.
+COMMANDS = {
+    "export": ("export_features.py", "Extract feature vectors from a Git repository"),
+    "label": ("build_cutoff_datasets.py", "Relabel a feature CSV as of cutoff dates"),
+    "train": ("train_model.py", "Train the bugfix classifier"),
+    "retrain": ("retrain_model.py", "Fine-tune the current model on new and relabelled commits"),
+    "predict": ("predict.py", "Score commits with the trained model"),
+    "evaluate": ("evaluate_prediction_quality.py", "Confusion matrix and classification report"),
+    "explain": ("shap_analysis.py", "SHAP feature importance plot"),
+    "report": ("build_report.py", "Headless HTML/PNG report of dataset and predictions"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Top-level parser, used for kbp.py's own help and usage errors only. Everything after
+    the subcommand is forwarded to the script untouched, so it is never parsed here.
+    """
+    parser = argparse.ArgumentParser(prog="kbp.py", description="Kernel bug predictor pipeline",
+                                     epilog="Run 'kbp.py <command> --help' for the options of a command.")
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="<command>")
+    for name, (script, description) in COMMANDS.items():
+        subparsers.add_parser(name, help=f"{description} (runs {script})")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS:
+        # No or unknown subcommand: argparse prints the help or the usage error and exits
+        build_parser().parse_args(argv[:1])
+        sys.exit(2)
+
+    command, script_args = argv[0], argv[1:]
+    script = os.path.join(SCRIPTS_DIR, COMMANDS[command][0])
+
+    # Run the script as if it had been called directly
+    sys.argv = [script] + script_args
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
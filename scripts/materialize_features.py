@@ -0,0 +1,17 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from features.feature_matrix import materialize_feature_matrix
+
+
+if len(sys.argv) != 3:
+    print("Usage: python materialize_features.py <features_csv> <output_dir>")
+    sys.exit(1)
+
+csv_path = sys.argv[1]
+output_dir = sys.argv[2]
+
+manifest = materialize_feature_matrix(csv_path, output_dir)
+print(f"Materialised {manifest['rows']} rows x {len(manifest['columns'])} features to {output_dir}")
+print("Columns:", ", ".join(manifest["columns"]))
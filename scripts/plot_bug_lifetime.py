@@ -7,17 +7,22 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 from extract.git_feature_extractor import GitFeatureExtractor
 
-if len(sys.argv) != 2:
-    print("Usage: python plot_bug_lifetime.py <linux-repo-path>")
+if len(sys.argv) not in (2, 3):
+    print("Usage: python plot_bug_lifetime.py <linux-repo-path> [lifetimes_csv]")
     sys.exit(1)
 
 repo_path = sys.argv[1]
+lifetimes_csv = sys.argv[2] if len(sys.argv) == 3 else None
 extractor = GitFeatureExtractor(repo_path)
 
 lifetimes = extractor.extract_bug_lifetimes("v2.6.12...v6.14")  
 
 df = pd.DataFrame(lifetimes, columns=["bug_lifetime_days"])
-#df.to_csv("Buglifetime")
+
+# Saved lifetimes can be included in build_report.py without another history walk
+if lifetimes_csv is not None:
+    df.to_csv(lifetimes_csv, index=False)
+    print(f"Bug lifetimes saved to {lifetimes_csv}")
 
 
 # Plot
@@ -1,34 +1,69 @@
 import pandas as pd
 import numpy as np
 import sys
+import os
+import argparse
+import time
 import joblib
-from tensorflow.keras.models import load_model
 
-if len(sys.argv) != 3:
-    print("Usage: python predict.py <input_features_csv> <output_predictions_csv>")
-    sys.exit(1)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from features.feature_matrix import FeatureMatrix, is_feature_matrix, scale_matrix
+from monitor.drift import FeatureSketches, drift_report
+from monitor.triage import TriageQueue
+from model.backends import MODEL_PATHS, SCALER_PATHS, INPUT_DTYPES, load_model, predict_proba, sketches_path
+from model.attribution import attribute, top_contributions
 
-input_csv = sys.argv[1]
-output_csv = sys.argv[2]
+parser = argparse.ArgumentParser(description="Apply the trained model to new data.")
+parser.add_argument("input_csv", help="input features CSV or matrix directory")
+parser.add_argument("output_csv", help="output predictions CSV")
+parser.add_argument("--backend", choices=list(MODEL_PATHS), default="keras", help="model backend")
+parser.add_argument("--model", help="trained model (default: the backend's model in models/)")
+parser.add_argument("--scaler", help="fitted scaler (default: the backend's scaler in models/)")
+parser.add_argument("--drift-state", help="sketches of all scored batches; updated and compared with the "
+                                          "training sketches stored next to the scaler")
+parser.add_argument("--triage-state", help="persistent top-K triage queue fed with the scored commits")
+parser.add_argument("--triage-k", type=int, default=20, help="commits kept per window and subsystem (new queues only)")
+parser.add_argument("--explain", type=int, metavar="N", help="add the N features contributing most to each "
+                                                                "score (signed log-odds vs. the training mean)")
+parser.add_argument("--attribution", choices=["gradient", "integrated"], default="gradient",
+                    help="network attribution: gradient x input or integrated gradients")
+parser.add_argument("--ig-steps", type=int, default=16, help="integration steps for integrated gradients")
+args = parser.parse_args()
+args.scaler = args.scaler or SCALER_PATHS[args.backend]
 
-df = pd.read_csv(input_csv)
+input_csv = args.input_csv
+output_csv = args.output_csv
 
-# Keep commit_hash for output
-ids = df["commit_hash"]
+# Load scaler
+scaler = joblib.load(args.scaler)
 
-# Drop unused / non-numeric columns
-drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date", "label"]
-X = df.drop(columns=[col for col in drop_cols if col in df.columns])
+if is_feature_matrix(input_csv):
+    matrix = FeatureMatrix(input_csv)
+    ids = matrix.commit_hashes()
+    X_scaled = scale_matrix(matrix, scaler, dtype=INPUT_DTYPES[args.backend])
+    dates = subsystems = None
+else:
+    df = pd.read_csv(input_csv)
 
-# Load scaler and apply
-scaler = joblib.load("models/scaler.pkl")
-X_scaled = scaler.transform(X)
+    # Keep commit_hash for output
+    ids = df["commit_hash"]
+    dates = df["commit_date"].to_numpy() if "commit_date" in df.columns else None
+    subsystems = df["subsystem_id"].to_numpy() if "subsystem_id" in df.columns else None
+
+    # Drop unused / non-numeric columns
+    drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date", "label"]
+    X = df.drop(columns=[col for col in drop_cols if col in df.columns])
+
+    # Apply scaler
+    X_scaled = scaler.transform(X)
 
 # Load model
-model = load_model("models/bugfix_model.keras")
+model = load_model(args.model or MODEL_PATHS[args.backend])
 
 # Predict
-y_pred_proba = model.predict(X_scaled).flatten()
+start = time.perf_counter()
+y_pred_proba = predict_proba(model, X_scaled)
+predict_seconds = time.perf_counter() - start
 
 # Combine result
 output = pd.DataFrame({
@@ -36,6 +71,50 @@ output = pd.DataFrame({
     "bugfix_probability": y_pred_proba
 })
 
+# Per-row explanations: top contributing features relative to the training mean
+if args.explain:
+    start = time.perf_counter()
+    attributions = attribute(model, X_scaled, method=args.attribution, steps=args.ig_steps)
+    explain_seconds = time.perf_counter() - start
+
+    top = top_contributions(attributions, list(scaler.feature_names_in_), args.explain)
+    output = pd.concat([output.reset_index(drop=True), top], axis=1)
+    print(f"Attributions computed in {explain_seconds:.2f}s (scoring took {predict_seconds:.2f}s)")
+
 # Save
 output.to_csv(output_csv, index=False)
 print(f"Predictions saved to {output_csv}")
+
+# Drift monitoring: only bin counts are kept, never the scored rows
+if args.drift_state:
+    reference_path = sketches_path(args.scaler)
+    if not os.path.exists(reference_path):
+        print(f"ERROR: no training sketches for {args.scaler} (expected {reference_path}).")
+        sys.exit(1)
+    reference = FeatureSketches.load(reference_path)
+    if reference.columns != list(scaler.feature_names_in_):
+        print("ERROR: feature sketches do not match the scaler's features.")
+        sys.exit(1)
+
+    current = FeatureSketches.load(args.drift_state) if os.path.exists(args.drift_state) else reference.empty_like()
+    if not current.same_bins(reference):
+        # The model was retrained since the state was started; old counts use other bins
+        print(f"Drift state {args.drift_state} uses different bins than the training sketches; starting over.")
+        current = reference.empty_like()
+    current.update(X_scaled, y_pred_proba)
+    current.save(args.drift_state)
+
+    print(f"\n=== Drift since first scored batch ({current.rows} commits) ===")
+    print(drift_report(reference, current).round(4).to_string(index=False))
+
+# Triage queue: top-K per window/subsystem and running score quantiles
+if args.triage_state:
+    queue = TriageQueue.load(args.triage_state) if os.path.exists(args.triage_state) else TriageQueue(k=args.triage_k)
+
+    # Without commit dates (matrix input) the scoring time is used
+    if dates is None:
+        dates = np.full(len(y_pred_proba), int(time.time()))
+
+    queue.add_batch(ids, y_pred_proba, dates, subsystems)
+    queue.save(args.triage_state)
+    print(f"\nTriage queue updated: {args.triage_state} (top 5% threshold overall: {queue.threshold(0.95):.3f})")
@@ -0,0 +1,136 @@
+import pandas as pd
+import numpy as np
+import sys
+import os
+import argparse
+import joblib
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import roc_auc_score
+from tensorflow import keras
+from tensorflow.keras.models import load_model
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from extract.as_of_labels import hashes_to_keys
+from model.training import balanced_class_weights, timed
+from model.backends import sketches_path
+from model.incremental import (ModelRegistry, label_snapshot, load_snapshot, find_delta, update_scaler,
+                               rescale_input_layer)
+from monitor.drift import FeatureSketches
+
+parser = argparse.ArgumentParser(description="Fine-tune the current model on new and relabelled commits.")
+parser.add_argument("features", help="Feature CSV with the current labels (e.g. after a new release)")
+parser.add_argument("--previous", help="Feature CSV the current model was trained on (first run only)")
+parser.add_argument("--registry", default="models/versions", help="Directory of the versioned artifacts")
+parser.add_argument("--model", default="models/bugfix_model.keras", help="Current model; replaced by the new version")
+parser.add_argument("--scaler", default="models/scaler.pkl", help="Current scaler; replaced by the new version")
+parser.add_argument("--replay-ratio", type=float, default=1.0,
+                    help="Previously seen rows replayed per new or relabelled row")
+parser.add_argument("--epochs", type=int, default=3, help="Fine-tuning epochs")
+parser.add_argument("--learning-rate", type=float, default=1e-4, help="Fine-tuning learning rate")
+parser.add_argument("--holdout-size", type=float, default=0.1,
+                    help="Share of the commits missing from --previous that go into the fixed holdout (first run)")
+parser.add_argument("--seed", type=int, default=42)
+args = parser.parse_args()
+
+df = pd.read_csv(args.features)
+keys = hashes_to_keys(df["commit_hash"])
+labels = df["label"].to_numpy(dtype=np.int8)
+registry = ModelRegistry(args.registry)
+
+
+def holdout_auc(model, scaler, X, y):
+    return float(roc_auc_score(y, model.predict(scaler.transform(X).astype(np.float32), verbose=0).flatten()))
+
+
+if not registry.exists():
+    # Register the current artifacts as version 0 and fix the holdout once
+    if not args.previous:
+        print("ERROR: the first run needs --previous <features_csv the current model was trained on>.")
+        sys.exit(1)
+
+    model = load_model(args.model)
+    scaler = joblib.load(args.scaler)
+    previous = pd.read_csv(args.previous, usecols=["commit_hash", "label"])
+    prev_keys, prev_labels = label_snapshot(previous["commit_hash"], previous["label"])
+
+    # The holdout comes only from commits version 0 has never seen, so its AUC is not inflated
+    unseen = ~np.isin(keys, prev_keys)
+    unseen_labels = labels[unseen]
+    if np.bincount(unseen_labels, minlength=2).min() < 2:
+        print("ERROR: the holdout needs at least two bugfix and two other commits missing from --previous.")
+        sys.exit(1)
+    _, holdout = train_test_split(keys[unseen], test_size=args.holdout_size, stratify=unseen_labels,
+                                  random_state=args.seed)
+    registry.save_holdout(holdout)
+    in_holdout = np.isin(keys, holdout)
+
+    X = df[list(scaler.feature_names_in_)]
+    registry.add_version(model, scaler, prev_keys, prev_labels, rows=len(prev_keys), new=0, relabelled=0, replay=0,
+                         train_seconds=0.0, holdout_auc=holdout_auc(model, scaler, X[in_holdout], labels[in_holdout]))
+    print(f"Registered {args.model} as version 0 in {args.registry}")
+else:
+    latest_dir = registry.version_dir(registry.latest())
+    model = load_model(os.path.join(latest_dir, "bugfix_model.keras"))
+    scaler = joblib.load(os.path.join(latest_dir, "scaler.pkl"))
+    prev_keys, prev_labels = load_snapshot(os.path.join(latest_dir, "labels.npz"))
+    in_holdout = np.isin(keys, registry.holdout_keys())
+
+X = df[list(scaler.feature_names_in_)]
+X_holdout, y_holdout = X[in_holdout], labels[in_holdout]
+previous_auc = holdout_auc(model, scaler, X_holdout, y_holdout)
+
+# Delta: new commits and commits whose label changed, never the holdout
+new, relabelled = find_delta(keys, labels, prev_keys, prev_labels)
+delta = (new | relabelled) & ~in_holdout
+print(f"{int((new & ~in_holdout).sum())} new, {int((relabelled & ~in_holdout).sum())} relabelled commits")
+if not delta.any():
+    print("Nothing to retrain.")
+    sys.exit(0)
+
+rng = np.random.default_rng(args.seed)
+seen = np.flatnonzero(~new & ~relabelled & ~in_holdout)
+replay = rng.choice(seen, size=min(len(seen), int(round(args.replay_ratio * delta.sum()))), replace=False)
+idx = np.concatenate([np.flatnonzero(delta), replay])
+rng.shuffle(idx)
+
+
+def fine_tune():
+    # Fold the new rows into the scaler and adapt the input layer so fine-tuning starts from the old outputs
+    new_scaler = update_scaler(scaler, X[new & ~in_holdout])
+    rescale_input_layer(model, scaler, new_scaler)
+
+    X_fit = new_scaler.transform(X.iloc[idx]).astype(np.float32)
+    y_fit = labels[idx]
+    model.compile(
+        optimizer=keras.optimizers.Adam(learning_rate=args.learning_rate),
+        loss="binary_crossentropy",
+        metrics=["accuracy", keras.metrics.AUC(name="auc")]
+    )
+    model.fit(X_fit, y_fit, epochs=args.epochs, batch_size=32, verbose=1, class_weight=balanced_class_weights(y_fit))
+    return new_scaler
+
+
+scaler, train_seconds = timed(fine_tune)
+auc = holdout_auc(model, scaler, X_holdout, y_holdout)
+
+snapshot_keys, snapshot_labels = label_snapshot(df["commit_hash"], labels)
+version_dir = registry.add_version(model, scaler, snapshot_keys, snapshot_labels, rows=len(df),
+                                   new=int((new & ~in_holdout).sum()), relabelled=int((relabelled & ~in_holdout).sum()),
+                                   replay=len(replay), train_seconds=train_seconds, holdout_auc=auc,
+                                   previous_holdout_auc=previous_auc)
+
+# The new version becomes the current model
+model.save(args.model)
+joblib.dump(scaler, args.scaler)
+
+# Drift reference in the new scaled space (scores from the holdout)
+X_reference = scaler.transform(X[~in_holdout]).astype(np.float32)
+holdout_scores = model.predict(scaler.transform(X_holdout).astype(np.float32), verbose=0).flatten()
+FeatureSketches.from_training_data(X_reference, list(scaler.feature_names_in_), scores=holdout_scores).save(
+    sketches_path(args.scaler))
+
+print(f"\nVersion {registry.latest()} saved to {version_dir} and installed as {args.model}")
+print(f"Fine-tuned on {len(idx)} rows in {train_seconds:.1f}s; holdout AUC {previous_auc:.4f} -> {auc:.4f}")
+
+print("\n=== Versions (holdout AUC as recorded at each version) ===")
+print(pd.DataFrame(registry.versions).drop(columns=["created"]).round(4).to_string(index=False))
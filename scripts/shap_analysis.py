@@ -3,37 +3,53 @@ import joblib
 import pandas as pd
 import numpy as np
 import sys
-from tensorflow.keras.models import load_model
+import os
 from sklearn.preprocessing import StandardScaler
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from features.feature_matrix import FeatureMatrix, is_feature_matrix, scale_matrix
+from model.backends import load_model, is_tree_model
+
 if len(sys.argv) != 4:
-    print("Usage: python shap_analysis.py <features_csv> <model_path> <scaler_path>")
+    print("Usage: python shap_analysis.py <features_csv_or_matrix_dir> <model_path> <scaler_path>")
     sys.exit(1)
 
 csv_path = sys.argv[1]
 model_path = sys.argv[2]
 scaler_path = sys.argv[3]
 
-df = pd.read_csv(csv_path)
-
-# Drop non-numeric columns
-drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date", "label", "tool_found"]
-X = df.drop(columns=[col for col in drop_cols if col in df.columns])
-feature_names = X.columns
-
-# Load scaler
+# Load scaler and model
 scaler = joblib.load(scaler_path)
-X_scaled = scaler.transform(X)
-
-# Load model
 model = load_model(model_path)
 
-# subset for speed
-X_sample = X_scaled[:10000]
-
-# Explain with SHAP
-explainer = shap.Explainer(model, X_sample)
+if is_feature_matrix(csv_path):
+    # Only the sampled rows are scaled; the rest of the matrix stays on disk
+    matrix = FeatureMatrix(csv_path)
+    feature_names = list(scaler.feature_names_in_)
+    # scikit-learn models are scored in float64, like in predict.py
+    dtype = np.float64 if hasattr(model, "predict_proba") else np.float32
+    X_sample = scale_matrix(matrix, scaler, rows=slice(0, 10000), dtype=dtype)
+else:
+    df = pd.read_csv(csv_path)
+
+    # Drop non-numeric columns
+    drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date", "label", "tool_found"]
+    X = df.drop(columns=[col for col in drop_cols if col in df.columns])
+    feature_names = X.columns
+
+    X_scaled = scaler.transform(X)
+
+    # subset for speed
+    X_sample = X_scaled[:10000]
+
+# Explain with SHAP: exact TreeSHAP for tree ensembles, closed form for linear models
+if is_tree_model(model):
+    explainer = shap.TreeExplainer(model)
+elif hasattr(model, "coef_"):
+    explainer = shap.LinearExplainer(model, X_sample)
+else:
+    explainer = shap.Explainer(model, X_sample)
 shap_values = explainer(X_sample)
 
 # Summary plot
@@ -0,0 +1,45 @@
+import sys
+import os
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from analysis.streaming_stats import stream_file_stats
+
+
+# Guard needed because worker processes may re-import this module
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3, 4):
+        print("Usage: python streaming_stats.py <features_csv> [chunk_rows] [workers]")
+        sys.exit(1)
+
+    csv_path = sys.argv[1]
+    chunk_rows = int(sys.argv[2]) if len(sys.argv) >= 3 else 100_000
+    workers = int(sys.argv[3]) if len(sys.argv) == 4 else 1
+
+    stats = stream_file_stats(csv_path, chunk_rows=chunk_rows, workers=workers)
+    overall = stats.pop("all")
+    pd.set_option("display.width", 200)
+
+    print("=== Datenform ===")
+    print(f"Rows: {overall.count}, Numeric columns: {len(overall.columns)}")
+
+    if stats:
+        print("\n=== Label Distribution ===")
+        for label in sorted(stats):
+            print(f"{label}: {stats[label].count}")
+
+    if "tool_found" in overall.columns:
+        tool_count = int(round(overall.mean[overall.columns.index("tool_found")] * overall.count))
+        print(f"\n{tool_count} commits were marked as fixed using known tools.")
+
+    print("\n=== Statistic summary ===")
+    print(overall.describe())
+
+    print("\n=== Mean per label ===")
+    print(pd.DataFrame({label: s.mean for label, s in sorted(stats.items())}, index=overall.columns).T)
+
+    print("\n=== Correlation ===")
+    print(overall.corr().round(3))
+
+    if "message_length" in overall.columns:
+        print(f"\nmessage_length 99% quantile: {overall.quantile('message_length', 0.99):.1f}")
@@ -1,71 +1,129 @@
 import pandas as pd
 import numpy as np
 import sys
+import os
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
-from tensorflow import keras
-from tensorflow.keras import layers
 import matplotlib.pyplot as plt
 from sklearn.metrics import roc_curve, roc_auc_score, classification_report, confusion_matrix
 import joblib
-from sklearn.utils import class_weight
-
-if len(sys.argv) != 2:
-    print("Usage: python train_model.py <features_csv>")
-    sys.exit(1)
-
-csv_path = sys.argv[1]
-df = pd.read_csv(csv_path)
-
-# Drop non-numeric and non-useful columns
-drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date"]
-X = df.drop(columns=drop_cols + ["label"])
-y = df["label"]
-
-# Scale features
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
-
-# Split
-X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, stratify=y, random_state=42)
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from features.feature_matrix import FeatureMatrix, is_feature_matrix, fit_scaler, scale_matrix
+from monitor.drift import FeatureSketches
+from model.training import build_model, balanced_class_weights, fit_subsampled, calibrate_output_layer, timed
+from model.backends import MODEL_PATHS, SCALER_PATHS, INPUT_DTYPES, train_backend, save_model, predict_proba, sketches_path, measure_backend
+
+parser = argparse.ArgumentParser(description="Train the bugfix classifier.")
+parser.add_argument("features", help="Feature CSV or materialized feature matrix directory")
+parser.add_argument("--neg-ratio", type=float, default=None,
+                    help="Train on all positives plus this many sampled negatives per positive, resampled every epoch")
+parser.add_argument("--hard-fraction", type=float, default=0.0,
+                    help="Share of the sampled negatives mined as hard negatives (highest scores under the current model)")
+parser.add_argument("--compare-baseline", action="store_true",
+                    help="Also train on the full data and report wall time and held-out AUC for both")
+parser.add_argument("--backend", choices=list(MODEL_PATHS), default="keras",
+                    help="Classifier to train: the Keras network, histogram gradient boosting or logistic regression")
+parser.add_argument("--compare-backends", action="store_true",
+                    help="Also train the other backends on the same split and compare AUC, training time, "
+                         "inference rows/sec and artifact size; only the --backend model is saved")
+args = parser.parse_args()
+if args.neg_ratio is None and (args.hard_fraction or args.compare_baseline):
+    parser.error("--hard-fraction and --compare-baseline require --neg-ratio")
+if args.compare_baseline and args.backend != "keras":
+    parser.error("--compare-baseline only applies to --backend keras")
+
+csv_path = args.features
+
+if is_feature_matrix(csv_path):
+    # Memory-mapped float32 matrix: scale straight into the train/test buffers
+    matrix = FeatureMatrix(csv_path)
+    y = np.asarray(matrix.label)
+    train_idx, test_idx = train_test_split(np.arange(len(matrix)), test_size=0.2, stratify=y, random_state=42)
+
+    scaler = fit_scaler(matrix, matrix.columns)
+    # float64 whenever a scikit-learn backend is trained (see model.backends.INPUT_DTYPES)
+    dtype = np.float64 if args.compare_backends else INPUT_DTYPES[args.backend]
+    X_train = scale_matrix(matrix, scaler, rows=train_idx, dtype=dtype)
+    X_test = scale_matrix(matrix, scaler, rows=test_idx, dtype=dtype)
+    y_train, y_test = y[train_idx], y[test_idx]
+else:
+    df = pd.read_csv(csv_path)
+
+    # Drop non-numeric and non-useful columns
+    drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date"]
+    X = df.drop(columns=drop_cols + ["label"])
+    y = df["label"]
+
+    # Scale features
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+
+    # Split
+    X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, stratify=y, random_state=42)
+
+y_train = np.asarray(y_train)
+y_test = np.asarray(y_test)
 
 # Compute class weights
-class_weights = class_weight.compute_class_weight(
-    class_weight="balanced",
-    classes=np.unique(y_train),
-    y=y_train
-)
-class_weight_dict = {i: w for i, w in enumerate(class_weights)}
+class_weight_dict = balanced_class_weights(y_train)
 print("Computed class weights:", class_weight_dict)
 
-# Define Keras model
-model = keras.Sequential([
-    keras.Input(shape=(X_train.shape[1],)),
-    layers.Dense(64, activation="relu"), 
-    layers.Dropout(0.2),
-    layers.Dense(32, activation="relu"),
-    layers.Dropout(0.1),
-    layers.Dense(1, activation="sigmoid")  # Binary classification
-])
-
-model.compile(
-    optimizer="adam",
-    loss="binary_crossentropy",
-    metrics=["accuracy", keras.metrics.AUC(name="auc")]
-)
-
-# Train the model
-history = model.fit(
-    X_train, y_train,
-    validation_data=(X_test, y_test),
-    epochs=10,
-    batch_size=32,
-    verbose=1,
-    class_weight=class_weight_dict    
-)
+
+def train_full():
+    model = build_model(X_train.shape[1])
+    model.fit(
+        X_train, y_train,
+        validation_data=(X_test, y_test),
+        epochs=10,
+        batch_size=32,
+        verbose=1,
+        class_weight=class_weight_dict
+    )
+    return model
+
+
+def train_subsampled():
+    # Keep a calibration slice out of the sampled training rows
+    X_fit, X_cal, y_fit, y_cal = train_test_split(X_train, y_train, test_size=0.1, stratify=y_train, random_state=42)
+    model = build_model(X_train.shape[1])
+    fit_subsampled(model, X_fit, y_fit, epochs=10, batch_size=32,
+                   neg_ratio=args.neg_ratio, hard_fraction=args.hard_fraction)
+    a, c = calibrate_output_layer(model, X_cal, y_cal)
+    print(f"Platt calibration folded into output layer: a={a:.3f}, c={c:.3f}")
+    return model
+
+
+def train_keras():
+    if args.neg_ratio is None:
+        return train_full()
+    print(f"Negative subsampling: {args.neg_ratio} negatives per positive, hard fraction {args.hard_fraction}")
+    return train_subsampled()
+
+
+def train(backend):
+    if backend == "keras":
+        return train_keras()
+    return train_backend(backend, X_train, y_train)
+
+
+model, train_seconds = timed(train, args.backend)
+print(f"Training time ({args.backend}): {train_seconds:.1f}s")
+
+if args.backend == "keras" and args.neg_ratio is not None and args.compare_baseline:
+    baseline, baseline_seconds = timed(train_full)
+    baseline_auc = roc_auc_score(y_test, baseline.predict(X_test, verbose=0).flatten())
+    sampled_auc = roc_auc_score(y_test, model.predict(X_test, verbose=0).flatten())
+    print("\n=== Subsampled vs. full-data training ===")
+    print(f"Full data:  {baseline_seconds:7.1f}s  AUC {baseline_auc:.4f}")
+    print(f"Subsampled: {train_seconds:7.1f}s  AUC {sampled_auc:.4f}")
+    print(f"Wall time saved: {baseline_seconds - train_seconds:.1f}s ({1 - train_seconds / baseline_seconds:.0%}), "
+          f"AUC change: {sampled_auc - baseline_auc:+.4f}")
 
 # Predict probabilities
-y_pred_proba = model.predict(X_test).flatten()
+y_pred_proba = predict_proba(model, X_test)
 y_pred = (y_pred_proba >= 0.5).astype(int)
 
 # Eval-Metriken
@@ -88,16 +146,34 @@ plt.grid(True)
 plt.tight_layout()
 plt.show()
 
-# Save model
-model.save("models/bugfix_model.keras")
-print("Model saved to models/bugfix_model.keras")
-
-# Save scaler
-joblib.dump(scaler, "models/scaler.pkl")
-print("Scaler saved to models/scaler.pkl")
-
-
-
-
-
 
+# Save model
+save_model(model, MODEL_PATHS[args.backend])
+print(f"Model saved to {MODEL_PATHS[args.backend]}")
+
+# Save scaler (one per backend, so other backends' models keep their own)
+joblib.dump(scaler, SCALER_PATHS[args.backend])
+print(f"Scaler saved to {SCALER_PATHS[args.backend]}")
+
+# Training distribution sketches for drift monitoring (scores from the held-out split)
+sketches = FeatureSketches.from_training_data(X_train, list(scaler.feature_names_in_), scores=y_pred_proba)
+sketches.save(sketches_path(SCALER_PATHS[args.backend]))
+print(f"Feature sketches saved to {sketches_path(SCALER_PATHS[args.backend])}")
+
+# Side-by-side comparison of all backends on the same split; the other backends are
+# only saved to a temporary directory to measure their artifact size
+if args.compare_backends:
+    rows = [dict(backend=args.backend, train_seconds=train_seconds,
+                 **measure_backend(model, MODEL_PATHS[args.backend], X_test, y_test))]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend in MODEL_PATHS:
+            if backend == args.backend:
+                continue
+            other, seconds = timed(train, backend)
+            path = os.path.join(tmp_dir, os.path.basename(MODEL_PATHS[backend]))
+            save_model(other, path)
+            rows.append(dict(backend=backend, train_seconds=seconds,
+                             **measure_backend(other, path, X_test, y_test)))
+
+    print("\n=== Backend comparison ===")
+    print(pd.DataFrame(rows).round(4).to_string(index=False))
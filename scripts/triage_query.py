@@ -0,0 +1,31 @@
+import sys
+import os
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from monitor.triage import TriageQueue
+
+
+if len(sys.argv) not in (2, 3, 4):
+    print("Usage: python triage_query.py <triage_state> [since_date] [quantile]")
+    print("since_date is a unix timestamp or a date like 2022-08-01; quantile defaults to 0.95.")
+    sys.exit(1)
+
+state_path = sys.argv[1]
+since_arg = sys.argv[2] if len(sys.argv) >= 3 else None
+quantile = float(sys.argv[3]) if len(sys.argv) == 4 else 0.95
+
+since = None
+if since_arg is not None:
+    since = int(since_arg) if since_arg.isdigit() else int(pd.Timestamp(since_arg, tz="UTC").timestamp())
+
+queue = TriageQueue.load(state_path)
+result = queue.above_threshold(quantile, since=since)
+
+print(f"=== Commits above the {quantile:.0%} quantile{' since ' + since_arg if since_arg else ''} ===")
+print(f"Threshold: {result['threshold']:.3f}")
+print(f"About {result['count']} commits above threshold, {len(result['commits'])} retained in the top-K heaps")
+
+commits = pd.DataFrame(result["commits"], columns=["bugfix_probability", "commit_hash", "commit_date"])
+commits["commit_date"] = pd.to_datetime(commits["commit_date"], unit="s")
+print(commits.to_string(index=False))
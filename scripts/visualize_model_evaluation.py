@@ -8,20 +8,30 @@ from tensorflow.keras.utils import plot_model
 from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score, roc_curve
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+from features.feature_matrix import FeatureMatrix, is_feature_matrix, scale_matrix
+
 if len(sys.argv) != 2:
-    print("Usage: python visualize_model_evaluation.py <features_csv>")
+    print("Usage: python visualize_model_evaluation.py <features_csv_or_matrix_dir>")
     sys.exit(1)
 
 csv_path = sys.argv[1]
-df = pd.read_csv(csv_path)
-
-drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date", "label"]
-X = df.drop(columns=[col for col in drop_cols if col in df.columns])
-y = df["label"]
 
 # Load scaler
 scaler = joblib.load("models/scaler.pkl")
-X_scaled = scaler.transform(X)
+
+if is_feature_matrix(csv_path):
+    matrix = FeatureMatrix(csv_path)
+    y = np.asarray(matrix.label)
+    X_scaled = scale_matrix(matrix, scaler)
+else:
+    df = pd.read_csv(csv_path)
+
+    drop_cols = ["commit_hash", "author", "committer", "author_date", "commit_date", "label"]
+    X = df.drop(columns=[col for col in drop_cols if col in df.columns])
+    y = df["label"]
+
+    X_scaled = scaler.transform(X)
 
 # Load model
 model = load_model("models/bugfix_model.keras")
@@ -0,0 +1,183 @@
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def compute_report_data(df: pd.DataFrame, predictions: pd.DataFrame = None, lifetimes: pd.Series = None,
+                        top_n: int = 20) -> dict:
+    """
+    Compute every statistic of the report from already loaded data.
+
+    Only small summaries (tables, histogram counts, ROC points) are kept, so the
+    figures can be rendered in other processes without shipping the raw data.
+
+    Args:
+        df (pd.DataFrame): Feature dataset with a 'label' column.
+        predictions (pd.DataFrame): Optional predictions with 'commit_hash' and 'bugfix_probability'.
+        lifetimes (pd.Series): Optional bug lifetimes in days.
+        top_n (int): Number of highest scoring commits to list.
+
+    Returns:
+        dict: Tables and figure specifications.
+    """
+    numeric = df.select_dtypes(include="number")
+    corr = numeric.corr()
+
+    data = {
+        "shape": df.shape,
+        "label_counts": df["label"].value_counts().sort_index(),
+        "tool_count": int(df["tool_found"].sum()) if "tool_found" in df.columns else None,
+        "describe": numeric.describe(),
+        "figures": [
+            {"name": "correlation_matrix", "kind": "heatmap", "title": "Correlation Matrix",
+             "matrix": corr.to_numpy(), "labels": list(corr.columns)}
+        ]
+    }
+
+    if predictions is not None:
+        probs = predictions["bugfix_probability"].to_numpy()
+        threshold = float(np.quantile(probs, 0.95))
+        counts, edges = np.histogram(probs, bins=30, range=(0, 1))
+
+        data["prediction_describe"] = predictions["bugfix_probability"].describe()
+        data["top_commits"] = predictions.nlargest(top_n, "bugfix_probability")
+        data["threshold_95"] = threshold
+        data["above_threshold"] = int((probs >= threshold).sum())
+        data["figures"].append({"name": "probability_histogram", "kind": "histogram",
+                                "title": "Distribution of Bugfix-Probability", "xlabel": "Probability",
+                                "ylabel": "Number Commits", "series": [("All commits", counts)], "edges": edges})
+
+        merged = predictions[["commit_hash", "bugfix_probability"]].merge(df[["commit_hash", "label"]], on="commit_hash")
+        if merged["label"].nunique() == 2:
+            from sklearn.metrics import roc_curve, roc_auc_score
+
+            y = merged["label"].to_numpy()
+            p = merged["bugfix_probability"].to_numpy()
+            fpr, tpr, _ = roc_curve(y, p)
+            data["auc"] = roc_auc_score(y, p)
+            data["figures"].append({"name": "roc_curve", "kind": "roc", "title": "Receiver Operating Characteristic",
+                                    "fpr": fpr, "tpr": tpr, "auc": data["auc"]})
+
+            data["figures"].append({"name": "prediction_histogram_by_class", "kind": "histogram",
+                                    "title": "Prediction Distribution by Class", "xlabel": "Predicted Probability",
+                                    "ylabel": "Number Commits", "edges": edges,
+                                    "series": [("True Bugfixes", np.histogram(p[y == 1], bins=edges)[0]),
+                                               ("Non-Bugfixes", np.histogram(p[y == 0], bins=edges)[0])]})
+
+    if lifetimes is not None and len(lifetimes):
+        counts, edges = np.histogram(lifetimes.to_numpy(), bins=250)
+        data["lifetime_describe"] = lifetimes.describe()
+        data["figures"].append({"name": "bug_lifetime", "kind": "histogram", "log_y": True,
+                                "title": "Distribution of Bug Lifetime (via Fixes-Tags)",
+                                "xlabel": "Bug Lifetime (days)", "ylabel": "Bugs Count",
+                                "series": [("Bugs", counts)], "edges": edges})
+
+    return data
+
+
+def render_figure(spec: dict, output_dir: str) -> str:
+    """
+    Render one figure specification to a PNG with the non-interactive Agg backend.
+
+    Returns:
+        str: File name of the written image.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    if spec["kind"] == "heatmap":
+        fig, ax = plt.subplots(figsize=(12, 10))
+        image = ax.imshow(spec["matrix"], cmap="coolwarm", vmin=-1, vmax=1)
+        ax.set_xticks(range(len(spec["labels"])), spec["labels"], rotation=90)
+        ax.set_yticks(range(len(spec["labels"])), spec["labels"])
+        fig.colorbar(image)
+    elif spec["kind"] == "roc":
+        fig, ax = plt.subplots()
+        ax.plot(spec["fpr"], spec["tpr"], label="ROC Curve (AUC = {:.3f})".format(spec["auc"]))
+        ax.plot([0, 1], [0, 1], linestyle="--", color="gray")
+        ax.set_xlabel("False Positive Rate")
+        ax.set_ylabel("True Positive Rate")
+        ax.legend()
+        ax.grid(True)
+    else:
+        fig, ax = plt.subplots(figsize=(12, 6) if spec.get("log_y") else None)
+        for label, counts in spec["series"]:
+            ax.stairs(counts, spec["edges"], fill=True, alpha=0.7, label=label)
+        if spec.get("log_y"):
+            ax.set_yscale("log")
+        if len(spec["series"]) > 1:
+            ax.legend()
+        ax.set_xlabel(spec["xlabel"])
+        ax.set_ylabel(spec["ylabel"])
+
+    ax.set_title(spec["title"])
+    fig.tight_layout()
+
+    file_name = spec["name"] + ".png"
+    fig.savefig(os.path.join(output_dir, file_name))
+    plt.close(fig)
+    return file_name
+
+
+def _table(frame) -> str:
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    return frame.to_html(float_format=lambda v: f"{v:.4g}")
+
+
+def write_report(data: dict, output_dir: str, workers: int = None) -> str:
+    """
+    Render all figures in parallel and write a static index.html next to them.
+
+    Args:
+        data (dict): Output of compute_report_data.
+        output_dir (str): Target directory.
+        workers (int): Number of rendering processes (default: one per figure, capped by CPU count).
+
+    Returns:
+        str: Path of the HTML report.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    figures = data["figures"]
+    workers = workers or min(len(figures), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        images = list(pool.map(render_figure, figures, [output_dir] * len(figures)))
+
+    rows, cols = data["shape"]
+    parts = [
+        "<html><head><meta charset='utf-8'><title>Kernel Bug Predictor Report</title></head><body>",
+        "<h1>Kernel Bug Predictor Report</h1>",
+        f"<p>Rows: {rows}, Columns: {cols}</p>",
+        "<h2>Label Distribution</h2>", _table(data["label_counts"]),
+    ]
+    if data["tool_count"] is not None:
+        parts.append(f"<p>{data['tool_count']} commits were marked as fixed using known tools.</p>")
+    parts += ["<h2>Statistic Summary</h2>", _table(data["describe"])]
+
+    if "prediction_describe" in data:
+        parts += [
+            "<h2>Prediction Summary</h2>", _table(data["prediction_describe"]),
+            f"<p>Top 5% Threshold: {data['threshold_95']:.3f} ({data['above_threshold']} commits above threshold)</p>",
+            f"<h3>Top {len(data['top_commits'])} highest scoring commits</h3>",
+            data["top_commits"].to_html(index=False),
+        ]
+        if "auc" in data:
+            parts.append(f"<p>ROC AUC: {data['auc']:.4f}</p>")
+
+    if "lifetime_describe" in data:
+        parts += ["<h2>Bug Lifetime (days)</h2>", _table(data["lifetime_describe"])]
+
+    parts.append("<h2>Figures</h2>")
+    for spec, image in zip(figures, images):
+        parts.append(f"<h3>{html.escape(spec['title'])}</h3><img src='{image}'>")
+    parts.append("</body></html>")
+
+    report_path = os.path.join(output_dir, "index.html")
+    with open(report_path, "w") as f:
+        f.write("\n".join(parts))
+    return report_path
@@ -0,0 +1,264 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error (DDSketch-style log buckets).
+
+    Values are counted in logarithmic buckets, so every quantile estimate is within
+    relative_accuracy of a value of the requested rank. Merging two sketches adds the
+    bucket counts, so partial sketches from parallel chunks combine exactly.
+
+    The error is relative to the distance from offset. Columns far from zero, such as
+    Unix timestamps, need an offset near their values (e.g. a median); otherwise a
+    single bucket spans months. Only sketches with the same offset can be merged.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, offset: float = 0.0):
+        self.relative_accuracy = relative_accuracy
+        self.offset = offset
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _add_buckets(self, store: dict, values: np.ndarray):
+        keys, counts = np.unique(np.ceil(np.log(values) / self.log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def update(self, values: np.ndarray):
+        """
+        Add a batch of values.
+        """
+        values = np.asarray(values, dtype=np.float64) - self.offset
+        values = values[~np.isnan(values)]
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+        self.zero_count += int((values == 0).sum())
+        self.count += len(values)
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Add the counts of another sketch with the same relative accuracy and offset.
+        """
+        if other.offset != self.offset:
+            raise ValueError(f"Cannot merge sketches with offsets {self.offset} and {other.offset}")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def _buckets(self):
+        # Ascending value order: negatives (largest magnitude first), zeros, positives
+        for key in sorted(self.negative, reverse=True):
+            yield self.offset - self._bucket_value(key), self.negative[key]
+        if self.zero_count:
+            yield self.offset, self.zero_count
+        for key in sorted(self.positive):
+            yield self.offset + self._bucket_value(key), self.positive[key]
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+        """
+        if self.count == 0:
+            return float("nan")
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, count in self._buckets():
+            seen += count
+            if seen > rank:
+                return value
+        return value
+
+    def rank(self, value: float) -> int:
+        """
+        Approximate number of values >= value.
+        """
+        return sum(count for bucket_value, count in self._buckets() if bucket_value >= value)
+
+
+class StreamingStats:
+    """
+    One-pass, mergeable statistics over a stream of numeric row blocks.
+
+    Count, mean and the co-moment matrix are combined block by block with the parallel
+    form of Welford's algorithm (Chan et al.), which gives variances and the full
+    correlation matrix without a second pass. Rows are expected to be complete; the
+    feature exports never contain missing values.
+
+    Quantiles are sketched relative to a per-column offset (see QuantileSketch). Pass
+    the same offsets, e.g. the median of the first block, to all partial statistics
+    that will be merged.
+    """
+
+    def __init__(self, columns: list[str], relative_accuracy: float = 0.01, offsets: np.ndarray = None):
+        self.columns = list(columns)
+        k = len(self.columns)
+        offsets = np.zeros(k) if offsets is None else np.asarray(offsets, dtype=np.float64)
+        self.count = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        self.sketches = [QuantileSketch(relative_accuracy, float(offset)) for offset in offsets]
+
+    def _combine(self, count: int, mean: np.ndarray, comoment: np.ndarray):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoment += comoment + np.outer(delta, delta) * (self.count * count / total)
+        self.mean += delta * (count / total)
+        self.count = total
+
+    def update(self, block: np.ndarray):
+        """
+        Add a block of rows (shape: rows x columns).
+        """
+        block = np.asarray(block, dtype=np.float64)
+        if len(block) == 0:
+            return
+
+        block_mean = block.mean(axis=0)
+        centered = block - block_mean
+        self._combine(len(block), block_mean, centered.T @ centered)
+
+        self.min = np.minimum(self.min, block.min(axis=0))
+        self.max = np.maximum(self.max, block.max(axis=0))
+        for i, sketch in enumerate(self.sketches):
+            sketch.update(block[:, i])
+
+    def merge(self, other: "StreamingStats"):
+        """
+        Merge partial statistics computed on another part of the data.
+        """
+        self._combine(other.count, other.mean, other.comoment)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+    def variance(self) -> np.ndarray:
+        """
+        Sample variance (ddof=1), like pandas.
+        """
+        return np.diag(self.comoment) / (self.count - 1) if self.count > 1 else np.full(len(self.columns), np.nan)
+
+    def quantile(self, column: str, q: float) -> float:
+        """
+        Approximate q-quantile of one column, clamped to the exact min/max.
+        """
+        i = self.columns.index(column)
+        return float(np.clip(self.sketches[i].quantile(q), self.min[i], self.max[i]))
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Summary table in the layout of pandas.DataFrame.describe().
+        """
+        rows = {
+            "count": np.full(len(self.columns), float(self.count)),
+            "mean": self.mean,
+            "std": np.sqrt(self.variance()),
+            "min": self.min,
+            "25%": [self.quantile(column, 0.25) for column in self.columns],
+            "50%": [self.quantile(column, 0.5) for column in self.columns],
+            "75%": [self.quantile(column, 0.75) for column in self.columns],
+            "max": self.max,
+        }
+        return pd.DataFrame(rows, index=self.columns).T
+
+    def corr(self) -> pd.DataFrame:
+        """
+        Pearson correlation matrix from the accumulated co-moments.
+        """
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.outer(std, std)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+def chunk_stats(block: np.ndarray, labels: np.ndarray, columns: list[str], offsets: np.ndarray = None) -> dict:
+    """
+    Statistics of one chunk, overall ("all") and per label value.
+    """
+    result = {"all": StreamingStats(columns, offsets=offsets)}
+    result["all"].update(block)
+
+    if labels is not None:
+        for label in np.unique(labels):
+            stats = StreamingStats(columns, offsets=offsets)
+            stats.update(block[labels == label])
+            result[label.item()] = stats
+    return result
+
+
+def merge_stats(target: dict, partial: dict):
+    """
+    Merge a chunk_stats result into an accumulated one.
+    """
+    for key, stats in partial.items():
+        if key in target:
+            target[key].merge(stats)
+        else:
+            target[key] = stats
+
+
+def stream_file_stats(csv_path: str, chunk_rows: int = 100_000, label_column: str = "label",
+                      workers: int = 1) -> dict:
+    """
+    Compute overall and per-label statistics of a feature CSV in one chunked pass.
+
+    Args:
+        csv_path (str): Feature CSV.
+        chunk_rows (int): Rows read per chunk.
+        label_column (str): Column used for the per-label breakdown.
+        workers (int): Processes accumulating chunks in parallel (1 = in-process).
+
+    Returns:
+        dict: {"all": StreamingStats, <label>: StreamingStats, ...}
+    """
+    result = {}
+    columns = offsets = None
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending = []
+
+    try:
+        for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+            if columns is None:
+                columns = list(chunk.select_dtypes(include="number").columns)
+
+            block = chunk[columns].to_numpy(dtype=np.float64)
+            if offsets is None:
+                # Quantile sketches measure relative error from the first chunk's median, so
+                # the error scales with the spread of a column rather than its magnitude
+                offsets = np.median(block, axis=0) if len(block) else np.zeros(len(columns))
+            labels = chunk[label_column].to_numpy() if label_column in chunk.columns else None
+
+            if pool is None:
+                merge_stats(result, chunk_stats(block, labels, columns, offsets))
+            else:
+                pending.append(pool.submit(chunk_stats, block, labels, columns, offsets))
+                # Bound the number of chunks held in memory
+                if len(pending) >= 2 * workers:
+                    merge_stats(result, pending.pop(0).result())
+
+        for future in pending:
+            merge_stats(result, future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return result
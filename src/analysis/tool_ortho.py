@@ -0,0 +1,144 @@
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def probability_bins(probs: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Index of the equal-width probability bin [i / n_bins, (i + 1) / n_bins) for every row.
+    """
+    return np.clip((np.asarray(probs) * n_bins).astype(np.int64), 0, n_bins - 1)
+
+
+def _bin_totals(bins: np.ndarray, tool: np.ndarray, n_bins: int, rows: int = 1) -> tuple:
+    """
+    Row counts and tool_found counts per bin for one or more resamples.
+
+    bins and tool have shape (rows, n); the result has shape (rows, n_bins).
+    """
+    flat = (np.arange(rows)[:, None] * n_bins + bins).ravel()
+    counts = np.bincount(flat, minlength=rows * n_bins).reshape(rows, n_bins)
+    tools = np.bincount(flat, weights=tool.ravel(), minlength=rows * n_bins).reshape(rows, n_bins)
+    return counts, tools
+
+
+def _bootstrap_chunk(bins: np.ndarray, tool: np.ndarray, n_bins: int, resamples: int, seed) -> tuple:
+    """
+    Bin totals for a block of bootstrap resamples drawn as one index matrix.
+    """
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(bins), size=(resamples, len(bins)))
+    return _bin_totals(bins[idx], tool[idx], n_bins, rows=resamples)
+
+
+def _threshold_rates(counts: np.ndarray, tools: np.ndarray) -> tuple:
+    """
+    Tool rates above and below every bin edge, derived from per-bin totals.
+
+    Returns:
+        tuple: (rate_above, rate_below), each of shape (..., n_bins + 1) for edges 0 .. 1.
+    """
+    zero = np.zeros(counts.shape[:-1] + (1,))
+    count_below = np.concatenate([zero, np.cumsum(counts, axis=-1)], axis=-1)
+    tools_below = np.concatenate([zero, np.cumsum(tools, axis=-1)], axis=-1)
+    count_above = count_below[..., -1:] - count_below
+    tools_above = tools_below[..., -1:] - tools_below
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return tools_above / count_above, tools_below / count_below
+
+
+def analyze_tool_orthogonality(df: pd.DataFrame, n_bins: int = 20, n_bootstrap: int = 2000, seed: int = 0,
+                               threshold_high: float = 0.5, threshold_low: float = 0.25,
+                               chunk_size: int = 100, workers: int = 1) -> dict:
+    """
+    Tool-found rates over the full population with bootstrap confidence intervals.
+
+    Rows are grouped into equal-width probability bins once. Every bootstrap resample
+    is a row of a NumPy index matrix, and per-bin totals for a whole block of resamples
+    come from one bincount. Rates above/below every bin edge (= every threshold) then
+    follow from cumulative sums. Seeds are spawned per block, so the result only depends
+    on seed, not on the number of workers.
+
+    Args:
+        df (pd.DataFrame): Needs 'bugfix_probability' and 'tool_found'.
+        n_bins (int): Number of probability bins; thresholds are the bin edges.
+        n_bootstrap (int): Number of bootstrap resamples.
+        seed (int): Seed for reproducible resampling.
+        threshold_high (float): Threshold of the HIGH group (must be a bin edge).
+        threshold_low (float): Threshold of the LOW group (must be a bin edge).
+        chunk_size (int): Resamples drawn per index matrix.
+        workers (int): Processes for the bootstrap blocks.
+
+    Returns:
+        dict: "bins" and "thresholds" tables plus the "high_vs_low" summary.
+    """
+    probs = df["bugfix_probability"].to_numpy()
+    tool = df["tool_found"].to_numpy(dtype=np.float64)
+    bins = probability_bins(probs, n_bins)
+    edges = np.linspace(0, 1, n_bins + 1)
+
+    high_edge = int(round(threshold_high * n_bins))
+    low_edge = int(round(threshold_low * n_bins))
+    if not (np.isclose(edges[high_edge], threshold_high) and np.isclose(edges[low_edge], threshold_low)):
+        raise ValueError(f"Thresholds must be multiples of 1/{n_bins}")
+
+    # Point estimates on the full population
+    counts, tools = _bin_totals(bins[None, :], tool[None, :], n_bins)
+    counts, tools = counts[0], tools[0]
+    rate_above, rate_below = _threshold_rates(counts, tools)
+
+    # Bootstrap blocks
+    block_sizes = [min(chunk_size, n_bootstrap - start) for start in range(0, n_bootstrap, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(block_sizes))
+    args = ([bins] * len(block_sizes), [tool] * len(block_sizes), [n_bins] * len(block_sizes), block_sizes, seeds)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(_bootstrap_chunk, *args))
+    else:
+        blocks = list(map(_bootstrap_chunk, *args))
+
+    boot_counts = np.concatenate([b[0] for b in blocks])
+    boot_tools = np.concatenate([b[1] for b in blocks])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        boot_bin_rates = boot_tools / boot_counts
+    boot_above, boot_below = _threshold_rates(boot_counts, boot_tools)
+
+    def ci(samples):
+        # Empty bins have no rate in any resample; keep them as NaN without a warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanpercentile(samples, [2.5, 97.5], axis=0)
+
+    bin_ci = ci(boot_bin_rates)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bin_table = pd.DataFrame({
+            "bin_start": edges[:-1], "bin_end": edges[1:],
+            "commits": counts, "tool_found": tools.astype(np.int64),
+            "tool_rate": tools / counts, "ci_low": bin_ci[0], "ci_high": bin_ci[1]
+        })
+
+    above_ci, below_ci = ci(boot_above), ci(boot_below)
+    threshold_table = pd.DataFrame({
+        "threshold": edges,
+        "rate_above": rate_above, "above_ci_low": above_ci[0], "above_ci_high": above_ci[1],
+        "rate_below": rate_below, "below_ci_low": below_ci[0], "below_ci_high": below_ci[1]
+    })
+
+    diff = boot_above[:, high_edge] - boot_below[:, low_edge]
+    diff_ci = np.nanpercentile(diff, [2.5, 97.5])
+    summary = {
+        "high_rate": rate_above[high_edge],
+        "high_commits": int(counts[high_edge:].sum()),
+        "low_rate": rate_below[low_edge],
+        "low_commits": int(counts[:low_edge].sum()),
+        "difference": rate_above[high_edge] - rate_below[low_edge],
+        "difference_ci": (diff_ci[0], diff_ci[1]),
+        "n_bootstrap": n_bootstrap,
+        "seed": seed
+    }
+
+    return {"bins": bin_table, "thresholds": threshold_table, "high_vs_low": summary}
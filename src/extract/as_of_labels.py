@@ -0,0 +1,134 @@
+import time
+
+import numpy as np
+
+
+# Fix time used for commits that were never fixed
+NEVER_FIXED = np.iinfo(np.int64).max
+
+
+def export_time(timestamp: int) -> int:
+    """
+    Convert a Git (UTC) timestamp to the time base of the feature CSVs.
+
+    The author_date and commit_date columns are written as mktime(gmtime(t)), which
+    shifts them by the exporting host's UTC offset. Other Git timestamps, such as fix
+    times, need the same shift before they are compared with those columns; run the
+    conversion in the time zone the features were exported in.
+    """
+    return int(time.mktime(time.gmtime(timestamp)))
+
+
+def hashes_to_keys(hashes) -> np.ndarray:
+    """
+    Convert 12-character short hashes to int64 keys for binary search.
+
+    Hashes that are not 12 hex characters (abbreviated 'Fixes:' references) cannot
+    match a short commit hash and are mapped to -1.
+
+    Args:
+        hashes (Iterable[str]): Short commit hashes.
+
+    Returns:
+        np.ndarray: int64 keys.
+    """
+    def to_key(h):
+        h = str(h)
+        if len(h) != 12:
+            return -1
+        try:
+            return int(h, 16)
+        except ValueError:
+            return -1
+
+    return np.fromiter((to_key(h) for h in hashes), dtype=np.int64)
+
+
+class AsOfLabelIndex:
+    """
+    Answers "was commit X labeled buggy as of time T" without re-walking Git history.
+
+    Buggy commits are kept as sorted int64 hash keys with the timestamp of their earliest
+    fix. A commit is buggy as of T if its earliest fix was committed at or before T, so
+    one history scan serves any number of cutoff dates.
+    """
+
+    def __init__(self, keys: np.ndarray, fix_times: np.ndarray):
+        """
+        Args:
+            keys (np.ndarray): Sorted, unique int64 hash keys of buggy commits.
+            fix_times (np.ndarray): Earliest fix timestamp for each key.
+        """
+        self.keys = keys
+        self.fix_times = fix_times
+
+    @classmethod
+    def from_fix_times(cls, fix_times: dict) -> "AsOfLabelIndex":
+        """
+        Build the index from GitFeatureExtractor.find_fix_timestamps output.
+        """
+        keys = hashes_to_keys(fix_times.keys())
+        times = np.fromiter(fix_times.values(), dtype=np.int64, count=len(fix_times))
+
+        valid = keys >= 0
+        keys, times = keys[valid], times[valid]
+
+        order = np.argsort(keys, kind="stable")
+        return cls(keys[order], times[order])
+
+    def save(self, path: str):
+        """
+        Store the index as a .npz file.
+        """
+        np.savez(path, keys=self.keys, fix_times=self.fix_times)
+
+    @classmethod
+    def load(cls, path: str) -> "AsOfLabelIndex":
+        """
+        Load an index written by save().
+        """
+        data = np.load(path)
+        return cls(data["keys"], data["fix_times"])
+
+    def lookup_fix_times(self, hashes) -> np.ndarray:
+        """
+        Earliest fix timestamp per commit, NEVER_FIXED for commits that were never fixed.
+
+        Args:
+            hashes: Short commit hashes (or int64 keys from hashes_to_keys).
+
+        Returns:
+            np.ndarray: int64 timestamps aligned with the input.
+        """
+        keys = hashes if isinstance(hashes, np.ndarray) and hashes.dtype == np.int64 else hashes_to_keys(hashes)
+        if len(self.keys) == 0:
+            return np.full(len(keys), NEVER_FIXED, dtype=np.int64)
+
+        pos = np.searchsorted(self.keys, keys)
+        pos = np.minimum(pos, len(self.keys) - 1)
+        found = self.keys[pos] == keys
+        return np.where(found, self.fix_times[pos], NEVER_FIXED)
+
+    def labels_as_of(self, hashes, cutoff: int) -> np.ndarray:
+        """
+        Binary bug labels as they were visible at a cutoff timestamp.
+
+        Args:
+            hashes: Short commit hashes (or int64 keys).
+            cutoff (int): Unix timestamp.
+
+        Returns:
+            np.ndarray: int8 labels.
+        """
+        return (self.lookup_fix_times(hashes) <= cutoff).astype(np.int8)
+
+    def labels_for_cutoffs(self, hashes, cutoffs) -> np.ndarray:
+        """
+        Labels for several cutoffs at once, sharing a single lookup.
+
+        Returns:
+            np.ndarray: int8 matrix of shape (len(hashes), len(cutoffs)).
+        """
+        fix_times = self.lookup_fix_times(hashes)
+        cutoffs = np.asarray(cutoffs, dtype=np.int64)
+        return (fix_times[:, None] <= cutoffs[None, :]).astype(np.int8)
@@ -0,0 +1,124 @@
+import heapq
+
+import joblib
+import numpy as np
+
+from extract.as_of_labels import hashes_to_keys, NEVER_FIXED
+
+
+# Feature columns emitted by AuthorHistoryTracker, in output order
+AUTHOR_HISTORY_FEATURES = [
+    "author_prior_commits",
+    "author_prior_bugs",
+    "author_bug_rate",
+    "author_idle_time",
+    "committer_author_pairs"
+]
+
+
+class AuthorHistoryTracker:
+    """
+    Streaming per-identity history features.
+
+    Commits must be fed in chronological order. For every commit the features only
+    describe what happened before it, then the running state is updated. An earlier
+    commit only counts as a prior bug once its first fix was committed, so 'Fixes:' tags
+    from after the current commit never leak into its features. The state is a handful
+    of integers per author and per (committer, author) pair plus a heap of pending fix
+    times per author, so a full-history export is processed in one O(n log n) pass and
+    the state can be saved and resumed.
+    """
+
+    def __init__(self):
+        self.author_commits = {}
+        self.author_bugs = {}
+        self.author_pending_fixes = {}
+        self.author_last_date = {}
+        self.pair_commits = {}
+        # int64 keys of consumed commits: sorted from earlier runs, unsorted from this one
+        self.consumed_keys = np.empty(0, dtype=np.int64)
+        self.new_keys = []
+
+    def seen(self, hashes) -> np.ndarray:
+        """
+        Mask of commits already consumed by an earlier (persisted) run.
+
+        Consumed commits are tracked by hash, not by date, because commits of the next
+        range can carry commit dates older than the last commit of the previous range.
+
+        Args:
+            hashes: Short commit hashes.
+
+        Returns:
+            np.ndarray: Boolean mask aligned with hashes.
+        """
+        keys = hashes_to_keys(hashes)
+        if len(self.consumed_keys) == 0:
+            return np.zeros(len(keys), dtype=bool)
+        pos = np.minimum(np.searchsorted(self.consumed_keys, keys), len(self.consumed_keys) - 1)
+        return self.consumed_keys[pos] == keys
+
+    def update(self, commit_hash: str, author: str, committer: str, author_date: int, commit_date: int,
+               fix_time: int = NEVER_FIXED) -> dict:
+        """
+        Compute history features for one commit and add it to the running state.
+
+        Args:
+            commit_hash (str): Short commit hash.
+            author (str): Author name.
+            committer (str): Committer name.
+            author_date (int): Author timestamp (seconds).
+            commit_date (int): Commit timestamp (seconds), used for ordering.
+            fix_time (int): Commit timestamp of the first 'Fixes:' tag citing this commit,
+                NEVER_FIXED if it was never fixed (see AsOfLabelIndex.lookup_fix_times).
+
+        Returns:
+            dict: Feature values, keyed by AUTHOR_HISTORY_FEATURES.
+        """
+        # Earlier commits of this author whose fix is visible by now become prior bugs
+        pending = self.author_pending_fixes.setdefault(author, [])
+        while pending and pending[0] <= commit_date:
+            heapq.heappop(pending)
+            self.author_bugs[author] = self.author_bugs.get(author, 0) + 1
+
+        prior_commits = self.author_commits.get(author, 0)
+        prior_bugs = self.author_bugs.get(author, 0)
+        last_author_date = self.author_last_date.get(author)
+        pair = (committer, author)
+
+        features = {
+            "author_prior_commits": prior_commits,
+            "author_prior_bugs": prior_bugs,
+            "author_bug_rate": prior_bugs / prior_commits if prior_commits else 0.0,
+            # Clamped, because author dates are not monotonic in commit order
+            "author_idle_time": max(0, author_date - last_author_date) if last_author_date is not None else -1,
+            "committer_author_pairs": self.pair_commits.get(pair, 0)
+        }
+
+        self.author_commits[author] = prior_commits + 1
+        if fix_time != NEVER_FIXED:
+            heapq.heappush(pending, int(fix_time))
+        self.author_last_date[author] = max(author_date, last_author_date or author_date)
+        self.pair_commits[pair] = self.pair_commits.get(pair, 0) + 1
+
+        self.new_keys.append(commit_hash)
+
+        return features
+
+    def save(self, path: str):
+        """
+        Persist the running state so a later run continues where this one stopped.
+        """
+        if self.new_keys:
+            self.consumed_keys = np.union1d(self.consumed_keys, hashes_to_keys(self.new_keys))
+            self.new_keys = []
+        joblib.dump(self.__dict__, path)
+
+    @classmethod
+    def load(cls, path: str) -> "AuthorHistoryTracker":
+        """
+        Restore a tracker saved with save().
+        """
+        tracker = cls()
+        tracker.__dict__.update(joblib.load(path))
+        return tracker
@@ -0,0 +1,129 @@
+import re
+from typing import Iterable, Iterator, NamedTuple
+
+
+DEV_NULL = "/dev/null"
+
+# File name suffixes of the header vs. source split
+HEADER_SUFFIXES = (".h",)
+SOURCE_SUFFIXES = (".c", ".S", ".s", ".rs")
+
+# Same header forms that unidiff accepts for `git diff` output
+DIFF_GIT_HEADER = re.compile(r'^diff --git (?P<source>"?a/[^\t\n]+"?) (?P<target>"?b/[^\t\n]+"?)')
+DIFF_GIT_HEADER_NO_PREFIX = re.compile(r"^diff --git (?P<source>[^\t\n]+) (?P<target>[^\t\n]+)")
+HUNK_HEADER = re.compile(rb"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@[ ]?(.*)")
+PATCH_FILE_PREFIX = re.compile(r"^[abciow12]/")
+
+
+class FileDiff(NamedTuple):
+    """
+    Summary of one file in a diff.
+    """
+    path: str
+    change_type: str  # "new", "deleted" or "modified"
+    added: int
+    removed: int
+    hunks: int
+    functions: frozenset  # non-empty @@ context headers (enclosing function lines)
+
+
+def _file_path(source: str, target: str) -> str:
+    """
+    Path of a file as unidiff's PatchedFile.path reports it.
+    """
+    path = source
+    if source == DEV_NULL or (target != DEV_NULL and source[2:] != target[2:]):
+        path = target  # added or renamed file
+
+    quoted = path.startswith('"') and path.endswith('"')
+    if quoted:
+        path = path[1:-1]
+    if PATCH_FILE_PREFIX.match(path):
+        path = path[2:]
+    return f'"{path}"' if quoted else path
+
+
+def _file_diff(source, target, added, removed, hunks, first_hunk, functions) -> FileDiff:
+    if source == DEV_NULL or (hunks == 1 and first_hunk[0] == 0 and first_hunk[1] == 0):
+        change_type = "new"
+    elif target == DEV_NULL or (hunks == 1 and first_hunk[2] == 0 and first_hunk[3] == 0):
+        change_type = "deleted"
+    else:
+        change_type = "modified"
+    return FileDiff(_file_path(source, target), change_type, added, removed, hunks, frozenset(functions))
+
+
+def iter_file_diffs(lines: Iterable[bytes]) -> Iterator[FileDiff]:
+    """
+    Stream `git diff` output and yield one FileDiff per file.
+
+    Lines are read once and no hunk or line objects are built. Hunk bodies are
+    delimited by the line counts in their @@ headers, so removed or added lines that
+    look like file headers ('--- ', '+++ ', 'diff --git') are counted correctly. The
+    results match unidiff.PatchSet for paths, change types and line/hunk counts.
+
+    Args:
+        lines (Iterable[bytes]): Raw diff lines, e.g. the stdout of a git process.
+
+    Yields:
+        FileDiff: Per-file summary, in diff order.
+    """
+    source = target = None
+    added = removed = hunks = 0
+    first_hunk = None
+    functions = set()
+    source_left = target_left = 0
+
+    for line in lines:
+        if source_left > 0 or target_left > 0:
+            marker = line[:1]
+            if marker == b"+":
+                added += 1
+                target_left -= 1
+            elif marker == b"-":
+                removed += 1
+                source_left -= 1
+            elif marker != b"\\":  # context, including empty lines
+                source_left -= 1
+                target_left -= 1
+            continue
+
+        if line.startswith(b"diff --git "):
+            if source is not None:
+                yield _file_diff(source, target, added, removed, hunks, first_hunk, functions)
+
+            header = line.decode("utf-8", errors="replace")
+            match = DIFF_GIT_HEADER.match(header) or DIFF_GIT_HEADER_NO_PREFIX.match(header)
+            source, target = match.group("source"), match.group("target")
+            added = removed = hunks = 0
+            first_hunk = None
+            functions = set()
+
+        elif line.startswith(b"@@ "):
+            match = HUNK_HEADER.match(line)
+            source_start, source_len, target_start, target_len, section = match.groups()
+            source_left = 1 if source_len is None else int(source_len)
+            target_left = 1 if target_len is None else int(target_len)
+
+            hunks += 1
+            if first_hunk is None:
+                first_hunk = (int(source_start), source_left, int(target_start), target_left)
+            section = section.strip()
+            if section:
+                functions.add(section.decode("utf-8", errors="replace"))
+
+        elif line.startswith(b"new file mode "):
+            source = DEV_NULL
+        elif line.startswith(b"deleted file mode "):
+            target = DEV_NULL
+
+    if source is not None:
+        yield _file_diff(source, target, added, removed, hunks, first_hunk, functions)
+
+
+def is_header_file(path: str) -> bool:
+    return path.endswith(HEADER_SUFFIXES)
+
+
+def is_source_file(path: str) -> bool:
+    return path.endswith(SOURCE_SUFFIXES)
@@ -0,0 +1,208 @@
+import json
+import re
+from typing import Iterable
+
+
+class _TrieNode:
+    __slots__ = ("children", "score", "subsystem_id")
+
+    def __init__(self):
+        self.children = {}
+        self.score = None
+        self.subsystem_id = 0
+
+
+class PathPrefixTrie:
+    """
+    Path-prefix trie used to score changed files by their most specific subsystem.
+
+    Every node corresponds to one path component. A lookup walks the components of a
+    file path and returns the score of the longest prefix that has one, so the cost
+    is O(path depth) independent of the number of configured prefixes.
+    """
+
+    def __init__(self, default_score: float = 0):
+        """
+        Args:
+            default_score (float): Score returned for paths without any matching prefix.
+        """
+        self.root = _TrieNode()
+        self.default_score = default_score
+        self.subsystems = ["unknown"]  # subsystem id 0 is reserved for "no match"
+        self._subsystem_ids = {}
+
+    def _subsystem_id(self, subsystem: str) -> int:
+        if subsystem is None:
+            return 0
+        if subsystem not in self._subsystem_ids:
+            self._subsystem_ids[subsystem] = len(self.subsystems)
+            self.subsystems.append(subsystem)
+        return self._subsystem_ids[subsystem]
+
+    def insert(self, prefix: str, score: float, subsystem: str = None, overwrite: bool = True):
+        """
+        Register a score (and optional subsystem name) for a path prefix.
+
+        Args:
+            prefix (str): Directory or file path, e.g. "drivers/gpu" or "include/linux/mm.h".
+            score (float): Complexity score for files below this prefix.
+            subsystem (str): Optional subsystem name; mapped to a stable integer id.
+            overwrite (bool): Replace an existing entry for the exact same prefix.
+        """
+        node = self.root
+        for part in prefix.strip("/").split("/"):
+            if not part:
+                continue
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+
+        if node.score is not None and not overwrite:
+            return
+        node.score = score
+        node.subsystem_id = self._subsystem_id(subsystem)
+
+    def lookup(self, path: str) -> tuple:
+        """
+        Find the longest configured prefix of a path.
+
+        Args:
+            path (str): Repository-relative file path.
+
+        Returns:
+            tuple: (score, subsystem_id) of the longest matching prefix.
+        """
+        node = self.root
+        score = self.default_score
+        subsystem_id = 0
+        for part in path.split("/"):
+            node = node.children.get(part)
+            if node is None:
+                break
+            if node.score is not None:
+                score = node.score
+                subsystem_id = node.subsystem_id
+        return score, subsystem_id
+
+    def score(self, path: str) -> float:
+        """
+        Complexity score of the longest matching prefix of a path.
+        """
+        return self.lookup(path)[0]
+
+    @classmethod
+    def from_dict(cls, scores: dict, default_score: float = 0) -> "PathPrefixTrie":
+        """
+        Build a trie from a flat {prefix: score} mapping such as DIR_COMPLEXITY.
+        """
+        trie = cls(default_score=default_score)
+        for prefix, score in scores.items():
+            trie.insert(prefix, score)
+        return trie
+
+    @classmethod
+    def from_config(cls, config_path: str) -> "PathPrefixTrie":
+        """
+        Load a trie from a JSON config file.
+
+        The file has the form:
+            {"default_score": 0,
+             "entries": [{"prefix": "drivers/gpu", "score": 4, "subsystem": "DRM DRIVERS"}, ...]}
+
+        Subsystem ids are assigned in order of first appearance, so they stay stable as
+        long as the config file does not change.
+
+        Args:
+            config_path (str): Path to the JSON config.
+
+        Returns:
+            PathPrefixTrie: The compiled trie.
+        """
+        with open(config_path) as f:
+            config = json.load(f)
+
+        trie = cls(default_score=config.get("default_score", 0))
+        for entry in config["entries"]:
+            trie.insert(entry["prefix"], entry["score"], entry.get("subsystem"))
+        return trie
+
+
+def parse_maintainers_patterns(lines: Iterable[str]) -> list[tuple[str, str]]:
+    """
+    Extract (subsystem, path prefix) pairs from the 'F:' patterns of a kernel MAINTAINERS file.
+
+    Glob patterns are cut at the first path component containing a wildcard, so
+    "drivers/gpu/drm/i915/*.c" becomes the prefix "drivers/gpu/drm/i915".
+
+    Args:
+        lines (Iterable[str]): Lines of the MAINTAINERS file.
+
+    Returns:
+        list: (subsystem name, prefix) pairs in file order.
+    """
+    wildcard = re.compile(r"[*?\[]")
+    pairs = []
+    subsystem = None
+    previous_blank = True
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+        if not line.strip():
+            previous_blank = True
+            continue
+
+        # Section headers are non-indented lines that follow a blank line, e.g. "DRM DRIVERS"
+        if previous_blank and not re.match(r"^[A-Z]:\s", line):
+            subsystem = line.strip()
+        previous_blank = False
+
+        if subsystem is None or not line.startswith("F:"):
+            continue
+
+        pattern = line[2:].strip()
+        parts = []
+        for part in pattern.strip("/").split("/"):
+            if wildcard.search(part):
+                break
+            parts.append(part)
+        if parts:
+            pairs.append((subsystem, "/".join(parts)))
+
+    return pairs
+
+
+def build_config_from_maintainers(maintainers_path: str, top_level_scores: dict, default_score: float = 0) -> dict:
+    """
+    Generate a trie config from a MAINTAINERS file.
+
+    Top-level scores are kept as the base layer; every 'F:' prefix inherits the score
+    of its top-level directory unless a more specific entry is edited in afterwards.
+    If several sections list the same prefix, the first one wins.
+
+    Args:
+        maintainers_path (str): Path to the kernel MAINTAINERS file.
+        top_level_scores (dict): Base {top_level_dir: score} mapping, e.g. DIR_COMPLEXITY.
+        default_score (float): Score for paths without any match.
+
+    Returns:
+        dict: Config in the format accepted by PathPrefixTrie.from_config.
+    """
+    with open(maintainers_path, encoding="utf-8", errors="replace") as f:
+        pairs = parse_maintainers_patterns(f)
+
+    entries = [{"prefix": prefix, "score": score, "subsystem": prefix} for prefix, score in top_level_scores.items()]
+    seen = set(top_level_scores)
+
+    for subsystem, prefix in pairs:
+        if prefix in seen:
+            continue
+        seen.add(prefix)
+        top_dir = prefix.split("/")[0]
+        entries.append({
+            "prefix": prefix,
+            "score": top_level_scores.get(top_dir, default_score),
+            "subsystem": subsystem
+        })
+
+    return {"default_score": default_score, "entries": entries}
@@ -1,9 +1,11 @@
 import git
 from typing import Iterator
-import time
 import re
-import io
-from unidiff import PatchSet
+from collections import Counter
+
+from extract.as_of_labels import export_time
+from extract.dir_complexity import PathPrefixTrie
+from extract.diff_scanner import iter_file_diffs, is_header_file, is_source_file
 
 
 # Used to assign complexity scores to top-level directories
@@ -34,16 +36,30 @@ class GitFeatureExtractor:
     This class provides methods to extract metadata and features from Git commits.
     """
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, complexity_config: str = None, hunk_features: bool = False):
         """
         Initialize the Git repository for feature extraction.
 
         Args:
             repo_path (str): Path to the local Git repository.
+            complexity_config (str): Optional JSON config with path-prefix complexity scores
+                (see extract.dir_complexity). Without it, only the top-level DIR_COMPLEXITY
+                scores are used and no subsystem features are emitted.
+            hunk_features (bool): Also emit line, hunk, function and header/source file
+                counts of the diff (see extract_diff_features).
         """
         self.repo_path = repo_path
         self.repo = git.Repo(repo_path)
 
+        if complexity_config is not None:
+            self.complexity_trie = PathPrefixTrie.from_config(complexity_config)
+            self.subsystem_features = True
+        else:
+            self.complexity_trie = PathPrefixTrie.from_dict(DIR_COMPLEXITY)
+            self.subsystem_features = False
+
+        self.hunk_features = hunk_features
+
     def is_informative_commit(self, commit: git.Commit) -> bool:
         """
         Determines whether a commit is useful for ML feature extraction.
@@ -64,11 +80,12 @@ class GitFeatureExtractor:
 
         """
         try:
-            diff_text = self.repo.git.diff(commit.parents[0].hexsha, commit.hexsha)
-            patch = PatchSet(io.StringIO(diff_text))
+            process = self.repo.git.diff(commit.parents[0].hexsha, commit.hexsha, as_process=True)
+            files = list(iter_file_diffs(process.stdout))
+            process.wait()
 
-            added = sum(hunk.added for f in patch for hunk in f)
-            removed = sum(hunk.removed for f in patch for hunk in f)
+            added = sum(f.added for f in files)
+            removed = sum(f.removed for f in files)
             if (added + removed) < 5:
                 return False
 
@@ -104,9 +121,9 @@ class GitFeatureExtractor:
             dict: Dictionary with commit metadata.
         """
         author_name = commit.author.name
-        author_date = int(time.mktime(time.gmtime(commit.authored_date)))
+        author_date = export_time(commit.authored_date)
         committer_name = commit.committer.name
-        commit_date = int(time.mktime(time.gmtime(commit.committed_date)))
+        commit_date = export_time(commit.committed_date)
         commit_delay = commit_date - author_date
         message_length = len(commit.message.strip())
 
@@ -177,45 +194,69 @@ class GitFeatureExtractor:
         Extracts patch-based features from a commit: number of changed files,
         overall impact score, and directory complexity.
 
+        Directory complexity uses the longest matching path prefix of the complexity trie.
+        If a complexity config was given, the dominant subsystem id and the number of
+        distinct subsystems touched are added as well. With hunk_features, added and
+        removed lines, hunk count, distinct touched functions (from the @@ context
+        headers) and the number of changed header and source files are added.
+
+        The output of `git diff` is streamed through the diff scanner line by line, so no
+        patch object graph is built.
+
         Args:
             commit (git.Commit): A GitPython commit object.
 
         Returns:
             dict: Dictionary with patch-related features.
         """
-        diff_text = self.repo.git.diff(commit.parents[0].hexsha, commit.hexsha)
-        patch = PatchSet(io.StringIO(diff_text))
+        process = self.repo.git.diff(commit.parents[0].hexsha, commit.hexsha, as_process=True)
 
         file_impact_total = 0
         dir_complexity_total = 0
         file_count = 0
+        subsystem_counts = Counter()
+        added = removed = hunks = functions = header_files = source_files = 0
 
-        for file in patch:
+        for file in iter_file_diffs(process.stdout):
             file_count += 1
+            file_impact_total += FILE_IMPACT.get(file.change_type, 0)
 
-            # Determine file change type
-            if file.is_added_file:
-                change_type = "new"
-            elif file.is_removed_file:
-                change_type = "deleted"
-            elif file.is_modified_file:
-                change_type = "modified"
-            else:
-                change_type = "huh"
+            # Score of the most specific configured directory
+            score, subsystem_id = self.complexity_trie.lookup(file.path)
+            dir_complexity_total += score
+            subsystem_counts[subsystem_id] += 1
 
-            file_impact_total += FILE_IMPACT.get(change_type, 0)
+            added += file.added
+            removed += file.removed
+            hunks += file.hunks
+            functions += len(file.functions)
+            header_files += is_header_file(file.path)
+            source_files += is_source_file(file.path)
 
-            # Determine top-level directory
-            filepath = file.path
-            top_dir = filepath.split("/")[0] if "/" in filepath else filepath
-            dir_complexity_total += DIR_COMPLEXITY.get(top_dir, 0)
+        process.wait()
 
-        return {
+        features = {
             "files_changed": file_count,
             "file_impact": file_impact_total,
             "dir_complexity": dir_complexity_total
         }
 
+        if self.subsystem_features:
+            features["subsystem_id"] = subsystem_counts.most_common(1)[0][0] if subsystem_counts else 0
+            features["subsystems_touched"] = len(subsystem_counts)
+
+        if self.hunk_features:
+            features.update({
+                "lines_added": added,
+                "lines_removed": removed,
+                "hunks": hunks,
+                "functions_touched": functions,
+                "header_files_changed": header_files,
+                "source_files_changed": source_files
+            })
+
+        return features
+
     def find_fixed_commits(self, revision_range: str = "v5.17...v6.14") -> set[str]:
         """
         Scan all commits for 'Fixes:' tags and collect the commit hashes they reference.
@@ -223,15 +264,29 @@ class GitFeatureExtractor:
         Returns:
             Set of short hashes (first 12 characters) of buggy commits that were fixed.
         """
-        fixed_hashes = set()
+        # Same scan as find_fix_timestamps, so both labelings always agree
+        return set(self.find_fix_timestamps(revision_range))
+
+    def find_fix_timestamps(self, revision_range: str = "v5.17...v6.14") -> dict:
+        """
+        Scan all commits for 'Fixes:' tags and record when each buggy commit was first fixed.
+
+        Args:
+            revision_range (str): Git revision range to scan.
+
+        Returns:
+            Dict: {short_buggy_commit_hash: earliest commit timestamp of a fixing commit}
+        """
+        fix_times = {}
 
         for commit in self.repo.iter_commits(revision_range, no_merges=True):
             matches = re.findall(r"Fixes:\s*([0-9a-f]{7,40})", commit.message, re.IGNORECASE)
             for m in matches:
                 short_hash = m.strip()[:12]
-                fixed_hashes.add(short_hash)
-    
-        return fixed_hashes
+                if short_hash not in fix_times or commit.committed_date < fix_times[short_hash]:
+                    fix_times[short_hash] = commit.committed_date
+
+        return fix_times
 
     def get_full_feature_vector(self, commit: git.Commit, fixed_hashes: set = None, bug_tool_map: dict = None) -> dict:
         """
@@ -0,0 +1,172 @@
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from extract.git_feature_extractor import GitFeatureExtractor
+
+
+MANIFEST_NAME = "manifest.json"
+
+# Per-process state, set once by _init_worker
+_worker_extractor = None
+_worker_fixed_hashes = None
+
+
+def partition_file_name(revision_range: str) -> str:
+    """
+    File name of the partition for a revision range, e.g. "v5.18...v5.19" -> "v5.18___v5.19.csv".
+
+    The two range operators select different commits, so they stay distinct:
+    "..." becomes "___" and ".." becomes "__".
+    """
+    name = revision_range.replace("...", "___").replace("..", "__")
+    return re.sub(r"[^\w.-]+", "_", name) + ".csv"
+
+
+def _init_worker(repo_path: str, fixed_hashes: set, hunk_features: bool = False):
+    global _worker_extractor, _worker_fixed_hashes
+    _worker_extractor = GitFeatureExtractor(repo_path, hunk_features=hunk_features)
+    _worker_fixed_hashes = fixed_hashes
+
+
+def _export_partition(revision_range: str, output_file: str) -> int:
+    """
+    Export the feature vectors of one revision range. Runs inside a worker process.
+
+    The CSV is written to a temporary file and renamed when complete, so an interrupted
+    partition never looks finished.
+
+    Returns:
+        int: Number of exported commits.
+    """
+    tmp_file = output_file + ".tmp"
+    rows = 0
+
+    try:
+        with open(tmp_file, mode="w", newline="") as csvfile:
+            writer = None
+
+            for commit in _worker_extractor.get_commits(revision_range):
+                features = _worker_extractor.get_full_feature_vector(commit, fixed_hashes=_worker_fixed_hashes)
+
+                if writer is None:
+                    writer = csv.DictWriter(csvfile, fieldnames=features.keys())
+                    writer.writeheader()
+
+                writer.writerow(features)
+                rows += 1
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+
+    os.replace(tmp_file, output_file)
+    return rows
+
+
+def load_manifest(output_dir: str) -> dict:
+    """
+    Load the manifest of an output directory, or an empty one if none exists yet.
+    """
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"fixes_range": None, "hunk_features": None, "partitions": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(output_dir: str, manifest: dict):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def run_release_jobs(repo_path: str, revision_ranges: list[str], output_dir: str,
+                     fixes_range: str = "v5.17...v6.14", workers: int = None, retries: int = 1,
+                     hunk_features: bool = False) -> dict:
+    """
+    Export one feature CSV per revision range, running the ranges in parallel.
+
+    The 'Fixes:' scan over fixes_range is done once in the parent process and handed
+    to every worker at start-up. Progress is recorded in manifest.json after each
+    partition, so a rerun only exports partitions that are missing or failed. A rerun
+    with another fixes_range or hunk_features setting exports all partitions again.
+
+    Args:
+        repo_path (str): Path to the local Git repository.
+        revision_ranges (list[str]): Ranges to export, e.g. ["v5.18...v5.19", "v5.19...v6.0"].
+        output_dir (str): Directory for the partition files and the manifest.
+        fixes_range (str): Enclosing range scanned for 'Fixes:' tags.
+        workers (int): Number of worker processes (default: one per pending range, capped by CPU count).
+        retries (int): How often a failed partition is retried within this run.
+        hunk_features (bool): Add the diff scanner's line/hunk/function features.
+
+    Returns:
+        dict: The final manifest.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+
+    # Completed partitions are only valid for the same fixes scan (labels) and the same
+    # feature set (columns); otherwise every partition is exported again
+    if manifest["fixes_range"] != fixes_range or manifest.get("hunk_features") != hunk_features:
+        manifest = {"fixes_range": fixes_range, "hunk_features": hunk_features, "partitions": {}}
+
+    pending = []
+    for revision_range in revision_ranges:
+        entry = manifest["partitions"].get(revision_range)
+        file_name = partition_file_name(revision_range)
+        if entry and entry["status"] == "done" and os.path.exists(os.path.join(output_dir, file_name)):
+            print(f"Skipping completed partition {revision_range}")
+            continue
+        manifest["partitions"][revision_range] = {"file": file_name, "status": "pending"}
+        pending.append(revision_range)
+
+    _write_manifest(output_dir, manifest)
+    if not pending:
+        return manifest
+
+    print(f"Scanning {fixes_range} for Fixes: tags...")
+    fixed_hashes = GitFeatureExtractor(repo_path).find_fixed_commits(fixes_range)
+
+    workers = workers or min(len(pending), os.cpu_count() or 1)
+    attempts = {revision_range: 0 for revision_range in pending}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(repo_path, fixed_hashes, hunk_features)) as pool:
+
+        def submit(revision_range):
+            attempts[revision_range] += 1
+            output_file = os.path.join(output_dir, partition_file_name(revision_range))
+            future = pool.submit(_export_partition, revision_range, output_file)
+            return future, revision_range, time.time()
+
+        running = {}
+        for revision_range in pending:
+            future, name, started = submit(revision_range)
+            running[future] = (name, started)
+
+        while running:
+            future = next(as_completed(running))
+            revision_range, started = running.pop(future)
+            entry = manifest["partitions"][revision_range]
+
+            try:
+                rows = future.result()
+            except Exception as e:
+                entry.update({"status": "failed", "error": str(e), "attempts": attempts[revision_range]})
+                print(f"Partition {revision_range} failed: {e}")
+                if attempts[revision_range] <= retries:
+                    retry, name, retry_started = submit(revision_range)
+                    running[retry] = (name, retry_started)
+            else:
+                entry.update({"status": "done", "rows": rows, "seconds": round(time.time() - started, 1)})
+                entry.pop("error", None)
+                print(f"Partition {revision_range}: {rows} commits -> {entry['file']}")
+
+            _write_manifest(output_dir, manifest)
+
+    return manifest
@@ -0,0 +1,186 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+
+# Columns that identify a commit or hold the target, never model inputs
+META_COLUMNS = ["commit_hash", "author", "committer", "author_date", "commit_date", "label"]
+
+MANIFEST_NAME = "manifest.json"
+
+
+class FeatureMatrix:
+    """
+    Read-only view of a materialised feature matrix.
+
+    The float32 features and the labels are memory-mapped, so loading is O(1) and
+    several processes reading the same matrix share the same physical pages.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Directory written by materialize_feature_matrix.
+        """
+        with open(os.path.join(path, MANIFEST_NAME)) as f:
+            self.manifest = json.load(f)
+
+        self.path = path
+        self.columns = self.manifest["columns"]
+        self.features = np.load(os.path.join(path, "features.npy"), mmap_mode="r")
+        self.commit_hash = np.load(os.path.join(path, "commit_hash.npy"), mmap_mode="r")
+        self.label = np.load(os.path.join(path, "label.npy"), mmap_mode="r") if self.manifest["has_label"] else None
+
+    def __len__(self) -> int:
+        return self.features.shape[0]
+
+    def column_indices(self, names) -> list[int]:
+        """
+        Positions of the given feature names in the matrix.
+
+        Raises:
+            KeyError: If a feature is not part of the matrix.
+        """
+        missing = [name for name in names if name not in self.columns]
+        if missing:
+            raise KeyError(f"Features missing from matrix {self.path}: {missing}")
+        return [self.columns.index(name) for name in names]
+
+    def commit_hashes(self, rows=slice(None)) -> np.ndarray:
+        """
+        Commit hashes as Python strings.
+        """
+        return np.char.decode(np.asarray(self.commit_hash[rows]), "ascii")
+
+
+def is_feature_matrix(path: str) -> bool:
+    """
+    True if path points to a materialised feature matrix instead of a CSV file.
+    """
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST_NAME))
+
+
+def materialize_feature_matrix(csv_path: str, output_dir: str, chunk_rows: int = 100_000) -> dict:
+    """
+    Convert a feature CSV into a float32 matrix on disk plus a column-order manifest.
+
+    The CSV is read in chunks and written straight into a preallocated .npy file, so
+    peak memory is one chunk regardless of the dataset size. A first chunked pass over
+    a single column counts the rows; raw line counts are too high when quoted fields
+    span several lines.
+
+    Args:
+        csv_path (str): Feature CSV produced by export_features.py.
+        output_dir (str): Target directory.
+        chunk_rows (int): Rows per CSV chunk.
+
+    Returns:
+        dict: The manifest.
+    """
+    rows = sum(len(chunk) for chunk in pd.read_csv(csv_path, usecols=["commit_hash"], chunksize=chunk_rows))
+
+    os.makedirs(output_dir, exist_ok=True)
+    features = labels = hashes = None
+    columns = None
+    has_label = False
+    offset = 0
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+        if columns is None:
+            columns = [col for col in chunk.columns
+                       if col not in META_COLUMNS and pd.api.types.is_numeric_dtype(chunk[col])]
+            has_label = "label" in chunk.columns
+
+            features = np.lib.format.open_memmap(os.path.join(output_dir, "features.npy"), mode="w+",
+                                                 dtype=np.float32, shape=(rows, len(columns)))
+            hashes = np.lib.format.open_memmap(os.path.join(output_dir, "commit_hash.npy"), mode="w+",
+                                               dtype="S12", shape=(rows,))
+            if has_label:
+                labels = np.lib.format.open_memmap(os.path.join(output_dir, "label.npy"), mode="w+",
+                                                   dtype=np.int8, shape=(rows,))
+
+        end = offset + len(chunk)
+        features[offset:end] = chunk[columns].to_numpy(dtype=np.float32)
+        hashes[offset:end] = chunk["commit_hash"].astype(str).to_numpy(dtype="S12")
+        if has_label:
+            labels[offset:end] = chunk["label"].to_numpy(dtype=np.int8)
+        offset = end
+
+    for array in (features, hashes, labels):
+        if array is not None:
+            array.flush()
+
+    manifest = {
+        "source": os.path.abspath(csv_path),
+        "rows": rows,
+        "columns": columns,
+        "dtype": "float32",
+        "has_label": has_label
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def fit_scaler(matrix: FeatureMatrix, columns: list[str], rows=None, chunk_rows: int = 100_000) -> StandardScaler:
+    """
+    Fit a StandardScaler chunk by chunk on the selected columns and rows.
+
+    The scaler records the column names like one fitted on a DataFrame, so it can still
+    be used by the CSV-based scripts.
+    """
+    col_idx = matrix.column_indices(columns)
+    rows = np.arange(len(matrix)) if rows is None else rows
+    scaler = StandardScaler()
+
+    for start in range(0, len(rows), chunk_rows):
+        block = matrix.features[rows[start:start + chunk_rows]][:, col_idx]
+        scaler.partial_fit(block.astype(np.float64))
+
+    scaler.feature_names_in_ = np.asarray(columns, dtype=object)
+    return scaler
+
+
+def scale_matrix(matrix: FeatureMatrix, scaler: StandardScaler, rows=None, chunk_rows: int = 100_000,
+                 dtype=np.float32) -> np.ndarray:
+    """
+    Apply a fitted scaler to the matrix and return an array of the given dtype.
+
+    Columns are taken in the scaler's fit order. Scaling runs chunk by chunk into a
+    single output buffer, so no float64 copy of the whole matrix is created unless
+    float64 output is requested.
+
+    Tree models compare inputs against exact split thresholds, so the scikit-learn
+    backends should be scored with dtype=np.float64: scaling in float32 moves values
+    across thresholds and changes their scores. The raw features are stored as float32,
+    so non-integer features can still differ slightly from scoring the CSV.
+
+    Args:
+        matrix (FeatureMatrix): Source matrix.
+        scaler (StandardScaler): Fitted scaler (with feature_names_in_).
+        rows: Optional row indices or slice to scale.
+        chunk_rows (int): Rows per chunk.
+        dtype: np.float32 (Keras) or np.float64 (scikit-learn backends).
+
+    Returns:
+        np.ndarray: Scaled array.
+    """
+    col_idx = matrix.column_indices(list(scaler.feature_names_in_))
+    if rows is None:
+        rows = np.arange(len(matrix))
+    elif isinstance(rows, slice):
+        rows = np.arange(len(matrix))[rows]
+
+    mean = scaler.mean_.astype(dtype)
+    scale = scaler.scale_.astype(dtype)
+    out = np.empty((len(rows), len(col_idx)), dtype=dtype)
+
+    for start in range(0, len(rows), chunk_rows):
+        block = matrix.features[rows[start:start + chunk_rows]][:, col_idx].astype(dtype, copy=False)
+        np.subtract(block, mean, out=block)
+        np.divide(block, scale, out=out[start:start + len(block)])
+
+    return out
@@ -0,0 +1,136 @@
+import os
+import time
+
+import joblib
+import numpy as np
+
+
+# backend -> default artifact path
+MODEL_PATHS = {
+    "keras": "models/bugfix_model.keras",
+    "hgb": "models/bugfix_model_hgb.pkl",
+    "logistic": "models/bugfix_model_logistic.pkl",
+}
+
+# backend -> scaler fitted in the same run as the model; each backend keeps its own
+SCALER_PATHS = {
+    "keras": "models/scaler.pkl",
+    "hgb": "models/scaler_hgb.pkl",
+    "logistic": "models/scaler_logistic.pkl",
+}
+
+# Input dtype per backend: float32 for the network, float64 for the scikit-learn models,
+# whose tree split thresholds are exact float64 values
+INPUT_DTYPES = {
+    "keras": np.float32,
+    "hgb": np.float64,
+    "logistic": np.float64,
+}
+
+
+def train_backend(backend: str, X_train: np.ndarray, y_train: np.ndarray, seed: int = 42):
+    """
+    Train one of the scikit-learn backends on the scaled training split.
+
+    Both use balanced class weights like the Keras model, so their probabilities are on
+    the same scale. The histogram gradient boosting model is multi-threaded through
+    OpenMP and supports exact TreeSHAP explanations.
+
+    Args:
+        backend (str): "hgb" or "logistic".
+        X_train (np.ndarray): Scaled training inputs.
+        y_train (np.ndarray): Training labels.
+        seed (int): Random state.
+
+    Returns:
+        Fitted scikit-learn classifier.
+    """
+    if backend == "hgb":
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        model = HistGradientBoostingClassifier(class_weight="balanced", early_stopping=False, random_state=seed)
+    elif backend == "logistic":
+        from sklearn.linear_model import LogisticRegression
+        model = LogisticRegression(class_weight="balanced", max_iter=1000)
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+
+    return model.fit(X_train, y_train)
+
+
+def sketches_path(scaler_path: str) -> str:
+    """
+    Training distribution sketches that belong to a scaler, stored next to it.
+
+    Sketches live in that scaler's scaled space and hold the score histogram of the model
+    trained with it, so they are keyed by the scaler file: models/scaler.pkl ->
+    models/feature_sketches.pkl, models/scaler_hgb.pkl -> models/feature_sketches_hgb.pkl,
+    models/other.pkl -> models/feature_sketches_other.pkl.
+    """
+    model_dir, file_name = os.path.split(scaler_path)
+    stem = os.path.splitext(file_name)[0]
+    suffix = stem[len("scaler"):] if stem.startswith("scaler") else f"_{stem}"
+    return os.path.join(model_dir, f"feature_sketches{suffix}.pkl")
+
+
+def save_model(model, path: str):
+    """
+    Save a Keras model natively and scikit-learn models with joblib.
+    """
+    if path.endswith(".keras"):
+        model.save(path)
+    else:
+        joblib.dump(model, path)
+
+
+def load_model(path: str):
+    """
+    Load a model written by save_model(). TensorFlow is only imported for Keras models.
+    """
+    if path.endswith(".keras"):
+        from tensorflow.keras.models import load_model as load_keras_model
+        return load_keras_model(path)
+    return joblib.load(path)
+
+
+def predict_proba(model, X: np.ndarray) -> np.ndarray:
+    """
+    Bugfix probability per row, whichever backend the model comes from.
+    """
+    if hasattr(model, "predict_proba"):
+        return model.predict_proba(X)[:, 1]
+    return model.predict(X, verbose=0).flatten()
+
+
+def is_tree_model(model) -> bool:
+    """
+    True for tree ensembles that shap.TreeExplainer explains exactly.
+    """
+    return type(model).__name__ in ("HistGradientBoostingClassifier", "GradientBoostingClassifier",
+                                    "RandomForestClassifier")
+
+
+def artifact_size(path: str) -> int:
+    """
+    Size of a saved model in bytes.
+    """
+    return os.path.getsize(path)
+
+
+def measure_backend(model, path: str, X_test: np.ndarray, y_test: np.ndarray, repeats: int = 3) -> dict:
+    """
+    Held-out AUC, inference throughput and artifact size of a saved model.
+    """
+    from sklearn.metrics import roc_auc_score
+
+    probs = predict_proba(model, X_test)  # warm-up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict_proba(model, X_test)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "auc": roc_auc_score(y_test, probs),
+        "rows_per_sec": len(X_test) / min(timings),
+        "artifact_kb": artifact_size(path) / 1024,
+    }
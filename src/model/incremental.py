@@ -0,0 +1,134 @@
+import copy
+import json
+import os
+import time
+
+import numpy as np
+
+from extract.as_of_labels import hashes_to_keys
+
+
+def label_snapshot(hashes, labels) -> tuple:
+    """
+    Sorted int64 hash keys and labels of a training set, used to find the next delta.
+    """
+    keys = hashes_to_keys(hashes)
+    order = np.argsort(keys)
+    return keys[order], np.asarray(labels, dtype=np.int8)[order]
+
+
+def save_snapshot(path: str, keys: np.ndarray, labels: np.ndarray):
+    np.savez_compressed(path, keys=keys, labels=labels)
+
+
+def load_snapshot(path: str) -> tuple:
+    with np.load(path) as data:
+        return data["keys"], data["labels"]
+
+
+def find_delta(keys: np.ndarray, labels: np.ndarray, prev_keys: np.ndarray, prev_labels: np.ndarray) -> tuple:
+    """
+    New and relabelled rows relative to the previous training set.
+
+    Args:
+        keys (np.ndarray): Hash keys of the current rows (any order).
+        labels (np.ndarray): Current labels.
+        prev_keys (np.ndarray): Sorted hash keys of the previous training set.
+        prev_labels (np.ndarray): Labels of the previous training set.
+
+    Returns:
+        tuple: Boolean masks (new, relabelled) over the current rows.
+    """
+    if len(prev_keys) == 0:
+        return np.ones(len(keys), dtype=bool), np.zeros(len(keys), dtype=bool)
+
+    pos = np.minimum(np.searchsorted(prev_keys, keys), len(prev_keys) - 1)
+    known = prev_keys[pos] == keys
+    relabelled = known & (prev_labels[pos] != labels)
+    return ~known, relabelled
+
+
+def update_scaler(scaler, X_new):
+    """
+    Copy of a fitted StandardScaler with the new rows folded into its running statistics.
+    """
+    updated = copy.deepcopy(scaler)
+    if len(X_new):
+        updated.partial_fit(X_new)
+    return updated
+
+
+def rescale_input_layer(model, old_scaler, new_scaler):
+    """
+    Adapt the first Dense layer to a changed scaler so the model's outputs stay the same.
+
+    With x_old = (raw - m_old) / s_old and x_new = (raw - m_new) / s_new, the old input is
+    x_old = x_new * s_new / s_old + (m_new - m_old) / s_old. Folding this into W x_old + b
+    scales the kernel rows by s_new / s_old and shifts the bias by the offset times W, so
+    fine-tuning starts from exactly the previous model.
+    """
+    layer = next(layer for layer in model.layers if layer.get_weights())
+    kernel, bias = layer.get_weights()
+
+    ratio = new_scaler.scale_ / old_scaler.scale_
+    offset = (new_scaler.mean_ - old_scaler.mean_) / old_scaler.scale_
+    layer.set_weights([(kernel * ratio[:, None]).astype(kernel.dtype), (bias + offset @ kernel).astype(bias.dtype)])
+
+
+class ModelRegistry:
+    """
+    Versioned model artifacts under one directory.
+
+    Every version lives in its own v<N>/ directory with the model, scaler and label
+    snapshot of its training set. registry.json lists the versions with their delta sizes,
+    training time and AUC on a fixed holdout; holdout.npy holds the hash keys of that
+    holdout, which are never used for fine-tuning.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.index_path = os.path.join(root, "registry.json")
+        self.holdout_path = os.path.join(root, "holdout.npy")
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.versions = json.load(f)["versions"]
+        else:
+            self.versions = []
+
+    def exists(self) -> bool:
+        return bool(self.versions)
+
+    def version_dir(self, version: int) -> str:
+        return os.path.join(self.root, f"v{version}")
+
+    def latest(self) -> int:
+        return self.versions[-1]["version"]
+
+    def holdout_keys(self) -> np.ndarray:
+        return np.load(self.holdout_path)
+
+    def save_holdout(self, keys: np.ndarray):
+        os.makedirs(self.root, exist_ok=True)
+        np.save(self.holdout_path, np.sort(keys))
+
+    def add_version(self, model, scaler, keys: np.ndarray, labels: np.ndarray, **info) -> str:
+        """
+        Store the artifacts of a new version and record it in registry.json.
+
+        Returns:
+            str: Directory of the new version.
+        """
+        import joblib
+
+        version = self.latest() + 1 if self.versions else 0
+        path = self.version_dir(version)
+        os.makedirs(path, exist_ok=True)
+
+        model.save(os.path.join(path, "bugfix_model.keras"))
+        joblib.dump(scaler, os.path.join(path, "scaler.pkl"))
+        save_snapshot(os.path.join(path, "labels.npz"), keys, labels)
+
+        self.versions.append({"version": version, "created": int(time.time()), **info})
+        with open(self.index_path, "w") as f:
+            json.dump({"versions": self.versions}, f, indent=2)
+        return path
@@ -0,0 +1,136 @@
+import time
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.utils import class_weight
+from tensorflow import keras
+from tensorflow.keras import layers
+
+
+def build_model(n_features: int) -> keras.Model:
+    """
+    The dense bugfix classifier used by train_model.py.
+    """
+    model = keras.Sequential([
+        keras.Input(shape=(n_features,)),
+        layers.Dense(64, activation="relu"),
+        layers.Dropout(0.2),
+        layers.Dense(32, activation="relu"),
+        layers.Dropout(0.1),
+        layers.Dense(1, activation="sigmoid")  # Binary classification
+    ])
+
+    model.compile(
+        optimizer="adam",
+        loss="binary_crossentropy",
+        metrics=["accuracy", keras.metrics.AUC(name="auc")]
+    )
+    return model
+
+
+def balanced_class_weights(y: np.ndarray) -> dict:
+    """
+    Class weights that give both classes the same total weight.
+    """
+    weights = class_weight.compute_class_weight(class_weight="balanced", classes=np.unique(y), y=y)
+    return {i: w for i, w in enumerate(weights)}
+
+
+def sample_epoch(y: np.ndarray, neg_ratio: float, rng: np.random.Generator, model: keras.Model = None,
+                 X: np.ndarray = None, hard_fraction: float = 0.0, pool_factor: int = 4) -> np.ndarray:
+    """
+    Row indices for one epoch: all positives plus a subsample of negatives.
+
+    With hard_fraction > 0 and a model, part of the negatives are hard negatives: a random
+    candidate pool of pool_factor times the needed size is scored with the current model
+    and its highest scoring negatives are kept. Only the pool is scored, so mining costs
+    O(pool) instead of a pass over all negatives.
+
+    Args:
+        y (np.ndarray): Training labels.
+        neg_ratio (float): Negatives per positive in the epoch.
+        rng (np.random.Generator): Random generator.
+        model (keras.Model): Current model, needed for hard negative mining.
+        X (np.ndarray): Training inputs, needed for hard negative mining.
+        hard_fraction (float): Share of the sampled negatives chosen as hard negatives.
+        pool_factor (int): Candidate pool size relative to the number of hard negatives.
+
+    Returns:
+        np.ndarray: Shuffled row indices.
+    """
+    positives = np.flatnonzero(y == 1)
+    negatives = np.flatnonzero(y == 0)
+    n_neg = min(len(negatives), int(round(neg_ratio * len(positives))))
+
+    n_hard = int(round(hard_fraction * n_neg)) if model is not None else 0
+    chosen = np.empty(0, dtype=np.int64)
+
+    if n_hard:
+        pool = rng.choice(negatives, size=min(len(negatives), pool_factor * n_hard), replace=False)
+        scores = model.predict_on_batch(X[pool]).ravel()
+        chosen = pool[np.argsort(scores)[::-1][:n_hard]]
+
+    remaining = np.setdiff1d(negatives, chosen, assume_unique=True)
+    uniform = rng.choice(remaining, size=n_neg - len(chosen), replace=False)
+
+    idx = np.concatenate([positives, chosen, uniform])
+    rng.shuffle(idx)
+    return idx
+
+
+def fit_subsampled(model: keras.Model, X: np.ndarray, y: np.ndarray, epochs: int = 10, batch_size: int = 32,
+                   neg_ratio: float = 3.0, hard_fraction: float = 0.0, seed: int = 42, verbose: int = 1):
+    """
+    Train with a fresh negative subsample each epoch.
+
+    Class weights are recomputed on every epoch sample, so the model is trained with the
+    same balanced objective as on the full data. Hard negatives are only mined after the
+    first epoch, once the model has something to score with.
+    """
+    rng = np.random.default_rng(seed)
+    for epoch in range(epochs):
+        idx = sample_epoch(y, neg_ratio, rng, model=model if epoch > 0 else None, X=X, hard_fraction=hard_fraction)
+        if verbose:
+            print(f"Epoch {epoch + 1}/{epochs}: {len(idx)} rows")
+        model.fit(X[idx], y[idx], epochs=1, batch_size=batch_size, verbose=verbose,
+                  class_weight=balanced_class_weights(y[idx]))
+    return model
+
+
+def calibrate_output_layer(model: keras.Model, X: np.ndarray, y: np.ndarray) -> tuple:
+    """
+    Platt-scale the model's output and fold the result into its last Dense layer.
+
+    A balanced logistic regression on the output logit maps scores onto the balanced
+    objective the full-data model is trained for. Since the last layer computes
+    sigmoid(w.h + b), the calibrated sigmoid(a * (w.h + b) + c) is obtained by replacing
+    w with a * w and b with a * b + c, so the saved model needs no extra step.
+
+    Args:
+        model (keras.Model): Trained model whose last layer is Dense(1, sigmoid).
+        X (np.ndarray): Calibration inputs (not used for training the model).
+        y (np.ndarray): Calibration labels.
+
+    Returns:
+        tuple: Platt parameters (a, c).
+    """
+    probs = np.clip(model.predict(X, verbose=0).ravel(), 1e-7, 1 - 1e-7)
+    logits = np.log(probs / (1 - probs)).reshape(-1, 1)
+
+    platt = LogisticRegression(class_weight="balanced")
+    platt.fit(logits, y)
+    a, c = float(platt.coef_[0, 0]), float(platt.intercept_[0])
+
+    last = model.layers[-1]
+    kernel, bias = last.get_weights()
+    last.set_weights([kernel * a, bias * a + c])
+    return a, c
+
+
+def timed(fn, *args, **kwargs) -> tuple:
+    """
+    Run fn and return (result, wall seconds).
+    """
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
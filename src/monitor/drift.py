@@ -0,0 +1,146 @@
+import joblib
+import numpy as np
+import pandas as pd
+
+
+# Proportion floor so empty bins do not make PSI infinite
+PSI_EPSILON = 1e-4
+
+
+def _midpoint_edges(values: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+    """
+    Bin edges near the given quantiles, placed midway between adjacent distinct values.
+
+    Edges never coincide with a data value, so float32 vs. float64 rounding of the same
+    (discrete) value cannot move it across an edge.
+    """
+    distinct = np.unique(values[~np.isnan(values)])
+    if len(distinct) < 2:
+        return np.empty(0)
+
+    midpoints = (distinct[:-1] + distinct[1:]) / 2
+    # For each quantile, the midpoint just above the quantile value
+    cut = np.searchsorted(distinct, np.quantile(values, quantiles), side="right") - 1
+    return np.unique(midpoints[np.clip(cut, 0, len(midpoints) - 1)])
+
+
+class FeatureSketches:
+    """
+    Compact per-feature histograms of the model inputs and of the predicted scores.
+
+    Feature bins are cut near quantiles of the training data, so each bin starts out with
+    roughly the same share of rows; the outermost bins are open-ended. Edges lie midway
+    between distinct training values, which keeps discrete features stable under rounding.
+    The score histogram uses fixed bins on [0, 1]. Only bin counts are stored, and new
+    batches are added incrementally with update().
+    """
+
+    def __init__(self, columns: list[str], edges: list[np.ndarray], score_edges: np.ndarray):
+        self.columns = list(columns)
+        self.edges = edges
+        self.score_edges = score_edges
+        self.counts = [np.zeros(len(e) + 1, dtype=np.int64) for e in edges]
+        self.score_counts = np.zeros(len(score_edges) - 1, dtype=np.int64)
+        self.rows = 0
+        self.scored_rows = 0
+
+    @classmethod
+    def from_training_data(cls, X: np.ndarray, columns: list[str], scores: np.ndarray = None,
+                           n_bins: int = 20) -> "FeatureSketches":
+        """
+        Build reference sketches from the (scaled) training inputs.
+
+        Args:
+            X (np.ndarray): Training inputs, shape rows x features.
+            columns (list[str]): Feature names in column order.
+            scores (np.ndarray): Optional predicted probabilities for a reference score histogram.
+            n_bins (int): Target number of bins per feature.
+
+        Returns:
+            FeatureSketches: Sketches filled with the training data.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+        edges = [_midpoint_edges(X[:, i], quantiles) for i in range(X.shape[1])]
+
+        sketches = cls(columns, edges, np.linspace(0, 1, n_bins + 1))
+        sketches.update(X, scores)
+        return sketches
+
+    def same_bins(self, other: "FeatureSketches") -> bool:
+        """
+        True if other has the same columns and bin edges, so their counts are comparable.
+        """
+        return (self.columns == other.columns and np.array_equal(self.score_edges, other.score_edges)
+                and len(self.edges) == len(other.edges)
+                and all(np.array_equal(a, b) for a, b in zip(self.edges, other.edges)))
+
+    def empty_like(self) -> "FeatureSketches":
+        """
+        New, empty sketches with the same bins (used to track scored batches).
+        """
+        return FeatureSketches(self.columns, self.edges, self.score_edges)
+
+    def update(self, X: np.ndarray, scores: np.ndarray = None):
+        """
+        Add a batch of inputs and, optionally, their predicted scores.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        for i, edges in enumerate(self.edges):
+            bins = np.searchsorted(edges, X[:, i], side="right")
+            self.counts[i] += np.bincount(bins, minlength=len(edges) + 1)
+        self.rows += len(X)
+
+        if scores is not None:
+            self.score_counts += np.histogram(np.clip(scores, 0, 1), bins=self.score_edges)[0]
+            self.scored_rows += len(scores)
+
+    def save(self, path: str):
+        """
+        Store the sketches with joblib, like the scaler.
+        """
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path: str) -> "FeatureSketches":
+        """
+        Load sketches written by save().
+        """
+        return joblib.load(path)
+
+
+def _psi_ks(reference: np.ndarray, current: np.ndarray) -> tuple:
+    """
+    Population stability index and Kolmogorov-Smirnov distance of two binned distributions.
+    """
+    if reference.sum() == 0 or current.sum() == 0:
+        return np.nan, np.nan
+
+    ref = np.maximum(reference / reference.sum(), PSI_EPSILON)
+    cur = np.maximum(current / current.sum(), PSI_EPSILON)
+    psi = float(np.sum((cur - ref) * np.log(cur / ref)))
+    ks = float(np.max(np.abs(np.cumsum(current) / current.sum() - np.cumsum(reference) / reference.sum())))
+    return psi, ks
+
+
+def drift_report(reference: FeatureSketches, current: FeatureSketches) -> pd.DataFrame:
+    """
+    PSI and KS distance per feature and for the score distribution.
+
+    Common rules of thumb for PSI: below 0.1 stable, 0.1 - 0.25 moderate shift,
+    above 0.25 significant shift.
+
+    Returns:
+        pd.DataFrame: One row per feature plus a 'bugfix_probability' row.
+    """
+    rows = []
+    for name, ref_counts, cur_counts in zip(reference.columns, reference.counts, current.counts):
+        psi, ks = _psi_ks(ref_counts, cur_counts)
+        rows.append({"feature": name, "psi": psi, "ks": ks})
+
+    psi, ks = _psi_ks(reference.score_counts, current.score_counts)
+    rows.append({"feature": "bugfix_probability", "psi": psi, "ks": ks})
+
+    report = pd.DataFrame(rows)
+    report["status"] = pd.cut(report["psi"], [-np.inf, 0.1, 0.25, np.inf], labels=["stable", "moderate", "shifted"])
+    return report
@@ -0,0 +1,157 @@
+import heapq
+
+import joblib
+import numpy as np
+
+from analysis.streaming_stats import QuantileSketch
+
+
+WINDOW_SECONDS = {"day": 86400, "week": 7 * 86400}
+
+
+class TriageQueue:
+    """
+    Persistent triage structure for continuously scored commits.
+
+    Keeps the K riskiest commits per time window and per subsystem in bounded min-heaps
+    (O(log K) per insert) and one mergeable quantile sketch of the scores per window.
+    Thresholds such as the top 5% since a date come from merging the window sketches,
+    so scored history is never re-sorted. Thresholds are resolved per window: a date in
+    the middle of a window counts the whole window.
+
+    Commits scored again are ignored. The hashes of the most recent dedup_windows windows
+    are kept for this, so memory stays bounded by the commits of those windows; in older
+    windows a re-scored commit is only recognised while it is still in the window's heap.
+    """
+
+    def __init__(self, k: int = 20, window: str = "week", relative_accuracy: float = 0.01,
+                 dedup_windows: int = 8):
+        """
+        Args:
+            k (int): Commits kept per window and per subsystem.
+            window (str): Window length, "day" or "week".
+            relative_accuracy (float): Relative error of the score quantile sketches.
+            dedup_windows (int): Most recent windows whose scored hashes are remembered.
+        """
+        self.k = k
+        self.window_seconds = WINDOW_SECONDS[window]
+        self.relative_accuracy = relative_accuracy
+        self.window_heaps = {}
+        self.subsystem_heaps = {}
+        self.window_sketches = {}
+        self.dedup_windows = dedup_windows
+        self.window_hashes = {}
+
+    def _push(self, heap: list, item: tuple):
+        if len(heap) < self.k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def add(self, commit_hash: str, score: float, commit_date: int, subsystem: int = None):
+        """
+        Insert a single scored commit.
+        """
+        self.add_batch([commit_hash], [score], [commit_date], None if subsystem is None else [subsystem])
+
+    def add_batch(self, hashes, scores, dates, subsystems=None):
+        """
+        Insert a batch of scored commits. Hashes already scored in the same window, or
+        repeated within the batch, are skipped so they enter neither the heaps nor the
+        sketches twice.
+
+        Args:
+            hashes: Commit hashes.
+            scores: Predicted probabilities.
+            dates: Commit timestamps (seconds).
+            subsystems: Optional subsystem ids.
+        """
+        dates = np.asarray(dates, dtype=np.int64)
+        windows = dates // self.window_seconds * self.window_seconds
+
+        keep = []
+        for i, (commit_hash, window) in enumerate(zip(map(str, hashes), windows.tolist())):
+            seen = self.window_hashes.get(window)
+            if seen is None:
+                # Window outside the remembered ones: fall back to its retained commits
+                seen = self.window_hashes[window] = {item[1] for item in self.window_heaps.get(window, [])}
+            if commit_hash not in seen:
+                seen.add(commit_hash)
+                keep.append(i)
+
+        for window in sorted(self.window_hashes)[:-self.dedup_windows]:
+            del self.window_hashes[window]
+
+        hashes = np.asarray(hashes, dtype=object)[keep]
+        scores = np.asarray(scores, dtype=np.float64)[keep]
+        dates, windows = dates[keep], windows[keep]
+        if subsystems is not None:
+            subsystems = np.asarray(subsystems)[keep]
+
+        for window in np.unique(windows):
+            in_window = windows == window
+            sketch = self.window_sketches.setdefault(int(window), QuantileSketch(self.relative_accuracy))
+            sketch.update(scores[in_window])
+
+        for i, (commit_hash, score, date, window) in enumerate(zip(hashes, scores.tolist(), dates, windows.tolist())):
+            item = (score, str(commit_hash), int(date))
+            self._push(self.window_heaps.setdefault(window, []), item)
+            if subsystems is not None:
+                self._push(self.subsystem_heaps.setdefault(int(subsystems[i]), []), item)
+
+    def _windows_since(self, since: int = None) -> list[int]:
+        start = None if since is None else since // self.window_seconds * self.window_seconds
+        return [w for w in self.window_sketches if start is None or w >= start]
+
+    def score_sketch(self, since: int = None) -> QuantileSketch:
+        """
+        Merged score sketch of all windows starting at or after the window containing since.
+        """
+        merged = QuantileSketch(self.relative_accuracy)
+        for window in self._windows_since(since):
+            merged.merge(self.window_sketches[window])
+        return merged
+
+    def threshold(self, q: float = 0.95, since: int = None) -> float:
+        """
+        Score threshold of the top (1 - q) share of commits since a date.
+        """
+        return self.score_sketch(since).quantile(q)
+
+    def top(self, n: int = None, since: int = None, subsystem: int = None) -> list[tuple]:
+        """
+        Highest scoring retained commits since a date, overall or for one subsystem, as
+        (score, hash, date) tuples.
+        """
+        if subsystem is not None:
+            items = [item for item in self.subsystem_heaps.get(subsystem, []) if since is None or item[2] >= since]
+        else:
+            items = [item for w in self._windows_since(since) for item in self.window_heaps[w]
+                     if since is None or item[2] >= since]
+        return sorted(items, reverse=True)[:n or self.k]
+
+    def above_threshold(self, q: float = 0.95, since: int = None) -> dict:
+        """
+        Commits above the q-quantile of all scores since a date.
+
+        Returns:
+            dict: threshold, approximate number of commits above it, and the retained
+            commits (at most K per window) above it.
+        """
+        sketch = self.score_sketch(since)
+        threshold = sketch.quantile(q)
+        commits = [item for item in self.top(n=len(self.window_heaps) * self.k, since=since) if item[0] >= threshold]
+        return {"threshold": threshold, "count": sketch.rank(threshold), "commits": commits}
+
+    def save(self, path: str):
+        """
+        Store the queue with joblib.
+        """
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path: str) -> "TriageQueue":
+        """
+        Load a queue written by save().
+        """
+        return joblib.load(path)